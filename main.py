@@ -1,18 +1,20 @@
 #!/usr/bin/env python3
 import sys
 
-import matplotlib
-matplotlib.use('QtAgg')
-
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
-from src.gui.main_window import MainWindow
 
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
+    # select the backend once the application exists, before any Figure is
+    # created; importing the window here keeps matplotlib off the cold path
+    import matplotlib
+    matplotlib.use('QtAgg')
+    from src.gui.main_window import MainWindow
+
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(245, 246, 250))
     palette.setColor(QPalette.ColorRole.WindowText, QColor(45, 52, 54))
@@ -0,0 +1,167 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _smooth_rates_np(rates, k, out):
+    if k <= 1:
+        out[:] = rates
+        return out
+    xp = np.pad(rates, (k // 2, k - 1 - k // 2), mode='edge')
+    c = np.cumsum(np.insert(xp, 0, 0.0))
+    np.subtract(c[k:], c[:-k], out=out)
+    out /= k
+    return out
+
+
+def _offset_indices_np(indices, offset, out):
+    np.add(indices, offset, out=out)
+    return out
+
+
+def _bin_spikes_np(times, t0, bin_width, out):
+    j = ((times - t0) / bin_width).astype(np.int64)
+    j = j[(j >= 0) & (j < out.shape[0])]
+    np.add.at(out, j, 1.0)
+    return out
+
+
+def _isi_stats_np(spike_times, short_isi):
+    isis = np.diff(spike_times)
+    if isis.size == 0:
+        return 0.0, 0.0, False
+    mean = float(isis.mean())
+    cv = float(isis.std() / mean) if mean > 0 else 0.0
+    return mean, cv, bool((isis < short_isi).any())
+
+
+def _decimate_minmax_np(t, v, idx, out_t, out_v):
+    n_bins = idx.shape[0] - 1
+    for i in range(n_bins):
+        s = v[idx[i]:idx[i + 1]]
+        out_v[2 * i] = s.min()
+        out_v[2 * i + 1] = s.max()
+        out_t[2 * i] = t[idx[i]]
+        out_t[2 * i + 1] = t[idx[i]]
+    return out_t, out_v
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _smooth_rates_nb(rates, k, out):
+        n = rates.shape[0]
+        if k <= 1:
+            for i in range(n):
+                out[i] = rates[i]
+            return out
+        half = k // 2
+        s = 0.0
+        for j in range(-half, k - half):
+            s += rates[min(max(j, 0), n - 1)]
+        out[0] = s / k
+        for i in range(1, n):
+            s += rates[min(i + k - 1 - half, n - 1)]
+            s -= rates[min(max(i - 1 - half, 0), n - 1)]
+            out[i] = s / k
+        return out
+
+    @njit(cache=True)
+    def _offset_indices_nb(indices, offset, out):
+        for i in range(indices.shape[0]):
+            out[i] = indices[i] + offset
+        return out
+
+    @njit(cache=True)
+    def _bin_spikes_nb(times, t0, bin_width, out):
+        n_bins = out.shape[0]
+        for k in range(times.shape[0]):
+            j = int((times[k] - t0) / bin_width)
+            if 0 <= j < n_bins:
+                out[j] += 1.0
+        return out
+
+    @njit(cache=True)
+    def _isi_stats_nb(spike_times, short_isi):
+        n = spike_times.shape[0] - 1
+        if n <= 0:
+            return 0.0, 0.0, False
+        s = 0.0
+        s2 = 0.0
+        any_short = False
+        prev = spike_times[0]
+        for i in range(1, n + 1):
+            d = spike_times[i] - prev
+            s += d
+            s2 += d * d
+            if d < short_isi:
+                any_short = True
+            prev = spike_times[i]
+        mean = s / n
+        var = s2 / n - mean * mean
+        cv = np.sqrt(max(var, 0.0)) / mean if mean > 0 else 0.0
+        return mean, cv, any_short
+
+    @njit(cache=True)
+    def _decimate_minmax_nb(t, v, idx, out_t, out_v):
+        n_bins = idx.shape[0] - 1
+        for i in range(n_bins):
+            lo = v[idx[i]]
+            hi = lo
+            for j in range(idx[i] + 1, idx[i + 1]):
+                x = v[j]
+                if x < lo:
+                    lo = x
+                elif x > hi:
+                    hi = x
+            out_v[2 * i] = lo
+            out_v[2 * i + 1] = hi
+            out_t[2 * i] = t[idx[i]]
+            out_t[2 * i + 1] = t[idx[i]]
+        return out_t, out_v
+
+    smooth_rates_into = _smooth_rates_nb
+    offset_indices_into = _offset_indices_nb
+    bin_spikes_into = _bin_spikes_nb
+    _decimate_minmax_into = _decimate_minmax_nb
+    _isi_stats = _isi_stats_nb
+else:
+    smooth_rates_into = _smooth_rates_np
+    offset_indices_into = _offset_indices_np
+    bin_spikes_into = _bin_spikes_np
+    _decimate_minmax_into = _decimate_minmax_np
+    _isi_stats = _isi_stats_np
+
+
+def smooth_rates(rates, k):
+    return smooth_rates_into(rates, k, np.empty_like(rates))
+
+
+def offset_indices(indices, offset):
+    return offset_indices_into(indices, offset, np.empty_like(indices))
+
+
+def bin_spikes(times, t0, duration, bin_width):
+    n_bins = max(int(np.ceil(duration / bin_width)), 1)
+    return bin_spikes_into(times, t0, bin_width, np.zeros(n_bins))
+
+
+def isi_stats(spike_times, short_isi=15.0):
+    """Mean ISI, CV(ISI) and whether any ISI is below short_isi, in one pass."""
+    return _isi_stats(spike_times, short_isi)
+
+
+def decimate_minmax(t, v, n_bins):
+    """Collapse (t, v) to two samples (min/max) per bin, preserving spikes.
+
+    Returns the inputs untouched when they are already at most two points
+    per bin, so callers can pass the display width unconditionally.
+    """
+    if len(v) <= 2 * n_bins or n_bins < 1:
+        return t, v
+    idx = np.linspace(0, len(v), n_bins + 1).astype(np.int64)
+    out_t = np.empty(2 * n_bins, dtype=t.dtype)
+    out_v = np.empty(2 * n_bins, dtype=v.dtype)
+    return _decimate_minmax_into(t, v, idx, out_t, out_v)
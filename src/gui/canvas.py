@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QApplication, QSizePolicy
+from PyQt6.QtWidgets import QSizePolicy
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
@@ -13,6 +13,6 @@ class MplCanvas(FigureCanvas):
         self.updateGeometry()
 
     def refresh(self):
-        self.draw()
-        self.flush_events()
-        QApplication.processEvents()
+        # draw_idle schedules a single paint on the Qt event loop, so several
+        # refresh() calls in one callback collapse into one Agg rasterization
+        self.draw_idle()
@@ -3,7 +3,6 @@ from PyQt6.QtWidgets import QMainWindow, QStackedWidget
 from src.gui.main_menu import MainMenuWidget
 from src.gui.single_neuron import SingleNeuronWidget
 from src.gui.neuron_explorer import NeuronExplorerWidget
-from src.gui.network_lab import NetworkLabWidget
 
 
 class MainWindow(QMainWindow):
@@ -26,21 +25,25 @@ class MainWindow(QMainWindow):
             on_complete=lambda: self.navigate_to('network_lab'),
             on_menu=lambda: self.navigate_to('menu')
         )
-        self.network_lab_widget = NetworkLabWidget(
-            on_menu=lambda: self.navigate_to('menu')
-        )
+        self.network_lab_widget = None
 
         self.central_widget.addWidget(self.menu_widget)
         self.central_widget.addWidget(self.single_neuron_widget)
         self.central_widget.addWidget(self.neuron_explorer_widget)
-        self.central_widget.addWidget(self.network_lab_widget)
 
         self.pages = {
             'menu': 0,
             'single_neuron': 1,
             'neuron_explorer': 2,
-            'network_lab': 3,
         }
 
     def navigate_to(self, page):
+        if page == 'network_lab' and self.network_lab_widget is None:
+            # deferred: importing the lab pulls in scipy and the Brian2
+            # network scenarios, which we skip until the user opens it
+            from src.gui.network_lab import NetworkLabWidget
+            self.network_lab_widget = NetworkLabWidget(
+                on_menu=lambda: self.navigate_to('menu')
+            )
+            self.pages['network_lab'] = self.central_widget.addWidget(self.network_lab_widget)
         self.central_widget.setCurrentIndex(self.pages.get(page, 0))
@@ -1,14 +1,57 @@
 import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider,
-    QLabel, QGroupBox, QComboBox, QApplication
+    QLabel, QGroupBox, QComboBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
+from matplotlib.colors import ListedColormap
+from matplotlib.lines import Line2D
 from scipy import signal
+from scipy.fft import set_workers
 
 from src.networks.scenarios import E_PV_Network, E_SOM_Network, E_PV_SOM_Network
 from src.gui.canvas import MplCanvas
+from src.gui._fast import smooth_rates_into, offset_indices, bin_spikes
+
+_SCENARIOS = [
+    ('gamma', '(E-PV)', '#e74c3c'),
+    ('theta', '(E-SOM)', '#2ecc71'),
+    ('coupled', '(E-PV-SOM)', '#9b59b6'),
+]
+
+# stylesheets are parsed by Qt's CSS engine on every setStyleSheet call,
+# so build each string once at import
+_SCENARIO_BTN_CSS = {
+    name: f"QPushButton {{ background-color: {color}; color: white; padding: 12px; border-radius: 5px; font-weight: bold; }} QPushButton:checked {{ border: 3px solid white; }}"
+    for name, _, color in _SCENARIOS
+}
+_SLIDER_LABEL_CSS = "color: #2d3436; font-size: 10px;"
+
+
+def _as_display_dtypes(spike_data):
+    """float32 times / int32 indices are plenty for plotting and halve Agg's
+    vertex traffic; no copy is made when the dtypes already match."""
+    return (np.ascontiguousarray(spike_data['times'], dtype=np.float32),
+            np.ascontiguousarray(spike_data['indices'], dtype=np.int32))
+
+
+class _SimSignals(QObject):
+    done = pyqtSignal(object, int)
+
+
+class SimWorker(QRunnable):
+    """Runs a network simulation off the GUI thread and reports back via signal."""
+
+    def __init__(self, network, duration_ms):
+        super().__init__()
+        self.network = network
+        self.duration_ms = duration_ms
+        self.signals = _SimSignals()
+
+    def run(self):
+        data = self.network.run_step(duration_ms=self.duration_ms)
+        self.signals.done.emit(data, self.duration_ms)
 
 
 class NetworkLabWidget(QWidget):
@@ -23,6 +66,15 @@ class NetworkLabWidget(QWidget):
         }
         self.current_network = None
         self.current_network_name = None
+        self._welch_cache = {}
+        self._smooth_buf = np.empty(0)
+        self._spectrum_bg = None
+        self._spectrum_artists = []
+        self._pending_labels = {}
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(16)
+        self._label_timer.timeout.connect(self._flush_label_updates)
         self.init_ui()
 
     def init_ui(self):
@@ -43,16 +95,11 @@ class NetworkLabWidget(QWidget):
         layout.addWidget(title)
 
         scenario_layout = QHBoxLayout()
-        scenarios = [
-            ('gamma', '(E-PV)', '#e74c3c'),
-            ('theta', '(E-SOM)', '#2ecc71'),
-            ('coupled', '(E-PV-SOM)', '#9b59b6'),
-        ]
         self.scenario_btns = {}
-        for name, label, color in scenarios:
+        for name, label, color in _SCENARIOS:
             btn = QPushButton(label)
             btn.setCheckable(True)
-            btn.setStyleSheet(f"QPushButton {{ background-color: {color}; color: white; padding: 12px; border-radius: 5px; font-weight: bold; }} QPushButton:checked {{ border: 3px solid white; }}")
+            btn.setStyleSheet(_SCENARIO_BTN_CSS[name])
             btn.clicked.connect(lambda checked, n=name: self.select_scenario(n))
             scenario_layout.addWidget(btn)
             self.scenario_btns[name] = btn
@@ -67,7 +114,6 @@ class NetworkLabWidget(QWidget):
 
         self.sliders = {}
         self.slider_labels = {}
-        self.slider_containers = {}
 
         self.scenario_sliders = {
             'gamma': [
@@ -97,7 +143,8 @@ class NetworkLabWidget(QWidget):
 
         self.sim_col = QVBoxLayout()
         self.duration_combo = QComboBox()
-        self.duration_combo.addItems(["1 sec", "2 sec", "5 sec"])
+        for label, ms in [("1 sec", 1000), ("2 sec", 2000), ("5 sec", 5000)]:
+            self.duration_combo.addItem(label, ms)
         self.duration_combo.setCurrentIndex(1)
         self.duration_combo.setStyleSheet("background-color: #dfe4ea; color: #2d3436; padding: 5px;")
         self.sim_col.addWidget(self.duration_combo)
@@ -107,6 +154,25 @@ class NetworkLabWidget(QWidget):
         self.simulate_btn.setStyleSheet("background-color: #27ae60; color: white; padding: 10px; border-radius: 5px; font-weight: bold;")
         self.sim_col.addWidget(self.simulate_btn)
 
+        # widget construction/destruction is expensive in Qt, so keep a fixed
+        # pool of label+slider columns and reconfigure them per scenario
+        self._slider_pool = []
+        for _ in range(max(len(c) for c in self.scenario_sliders.values())):
+            col_widget = QWidget()
+            col = QVBoxLayout(col_widget)
+            col.setContentsMargins(0, 0, 0, 0)
+            lbl = QLabel()
+            lbl.setStyleSheet(_SLIDER_LABEL_CSS)
+            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            col.addWidget(lbl)
+            slider = QSlider(Qt.Orientation.Horizontal)
+            slider.valueChanged.connect(lambda v, s=slider: self._on_pool_slider_changed(s, v))
+            col.addWidget(slider)
+            col_widget.hide()
+            self.params_layout.addWidget(col_widget)
+            self._slider_pool.append((col_widget, lbl, slider))
+        self.params_layout.addLayout(self.sim_col)
+
         layout.addWidget(self.params_box)
 
         self.description_label = QLabel("Select a scenario to begin!")
@@ -114,10 +180,12 @@ class NetworkLabWidget(QWidget):
         self.description_label.setWordWrap(True)
         layout.addWidget(self.description_label)
 
-        self.setup_plots()
+        self._build_axes()
 
-    def setup_plots(self):
-        self.canvas.fig.clear()
+    def _build_axes(self):
+        # axes, titles, bands and spines are static: build them exactly once
+        # and let display_results swap only the data artists
+        self._dynamic_artists = []
         self.canvas.fig.set_facecolor('#f5f6fa')
         gs = self.canvas.fig.add_gridspec(3, 1, height_ratios=[2, 1.5, 1.5], hspace=0.35)
 
@@ -149,7 +217,28 @@ class NetworkLabWidget(QWidget):
                 spine.set_color('#b2bec3')
 
         self.canvas.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+    def _on_canvas_draw(self, event):
+        # the spectrum data artists are animated, so a regular draw renders only
+        # the static axes; cache that as background and blit the artists on top
+        self._spectrum_bg = self.canvas.copy_from_bbox(self.ax_spectrum.bbox)
+        if self._spectrum_artists:
+            for artist in self._spectrum_artists:
+                self.ax_spectrum.draw_artist(artist)
+            self.canvas.blit(self.ax_spectrum.bbox)
+
+    def _clear_dynamic(self):
+        for artist in self._dynamic_artists:
+            try:
+                artist.remove()
+            except ValueError:
+                pass
+        self._dynamic_artists.clear()
+        self._spectrum_artists.clear()
+        legend = self.ax_raster.get_legend()
+        if legend is not None:
+            legend.remove()
 
     def select_scenario(self, name):
         for btn_name, btn in self.scenario_btns.items():
@@ -160,57 +249,59 @@ class NetworkLabWidget(QWidget):
 
         self._rebuild_sliders(name)
 
-        self.setup_plots()
+        self._clear_dynamic()
+        self.canvas.draw_idle()
 
     def _rebuild_sliders(self, scenario_name):
-        self.params_layout.removeItem(self.sim_col)
-
-        while self.params_layout.count():
-            item = self.params_layout.takeAt(0)
-            if item.layout():
-                while item.layout().count():
-                    child = item.layout().takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-            elif item.widget():
-                item.widget().deleteLater()
-
         self.sliders.clear()
         self.slider_labels.clear()
+        self._pending_labels.clear()
 
         slider_configs = self.scenario_sliders.get(scenario_name, [])
 
-        for param_name, label, min_v, max_v, default in slider_configs:
-            col = QVBoxLayout()
-            lbl = QLabel(f"{label}: {default/10:.1f}")
-            lbl.setStyleSheet("color: #2d3436; font-size: 10px;")
-            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.slider_labels[param_name] = lbl
-            col.addWidget(lbl)
-
-            slider = QSlider(Qt.Orientation.Horizontal)
-            slider.setRange(min_v, max_v)
-            slider.setValue(default)
-            slider.valueChanged.connect(lambda v, n=param_name, l=label: self.on_param_changed(n, v, l))
-            self.sliders[param_name] = slider
-            col.addWidget(slider)
-            self.params_layout.addLayout(col)
-
-        self.params_layout.addLayout(self.sim_col)
+        for i, (col_widget, lbl, slider) in enumerate(self._slider_pool):
+            if i < len(slider_configs):
+                param_name, label, min_v, max_v, default = slider_configs[i]
+                slider.blockSignals(True)
+                slider.setRange(min_v, max_v)
+                slider.setValue(default)
+                slider.blockSignals(False)
+                slider.setProperty('param', param_name)
+                slider.setProperty('label', label)
+                lbl.setText(f"{label}: {default/10:.1f}")
+                self.sliders[param_name] = slider
+                self.slider_labels[param_name] = lbl
+                col_widget.show()
+            else:
+                col_widget.hide()
+
+    def _on_pool_slider_changed(self, slider, value):
+        self.on_param_changed(slider.property('param'), value, slider.property('label'))
 
     def on_param_changed(self, name, value, label=None):
-        val = value / 10.0
-        if label:
-            self.slider_labels[name].setText(f"{label}: {val:.1f}")
-        else:
-            self.slider_labels[name].setText(f"{name.replace('_', '→').upper()}: {val:.1f}")
+        # coalesce: while the user drags, only the latest value per slider
+        # is flushed to its label once per timer tick
+        self._pending_labels[name] = (value, label)
+        self._label_timer.start()
+
+    def _flush_label_updates(self):
+        for name, (value, label) in self._pending_labels.items():
+            lbl = self.slider_labels.get(name)
+            if lbl is None:
+                continue
+            val = value / 10.0
+            if label:
+                lbl.setText(f"{label}: {val:.1f}")
+            else:
+                lbl.setText(f"{name.replace('_', '→').upper()}: {val:.1f}")
+        self._pending_labels.clear()
 
     def run_simulation(self):
         if self.current_network is None:
             self.description_label.setText("Select a scenario first!")
             return
 
-        duration_ms = int(self.duration_combo.currentText().split()[0]) * 1000
+        duration_ms = int(self.duration_combo.currentData())
 
         params = {}
         for name, slider in self.sliders.items():
@@ -250,57 +341,134 @@ class NetworkLabWidget(QWidget):
 
         self.simulate_btn.setEnabled(False)
         self.simulate_btn.setText("Running...")
-        QApplication.processEvents()
 
-        data = self.current_network.run_step(duration_ms=duration_ms)
+        worker = SimWorker(self.current_network, duration_ms)
+        worker.signals.done.connect(self._on_sim_done)
+        self._sim_worker = worker
+        QThreadPool.globalInstance().start(worker)
 
+    def _on_sim_done(self, data, duration_ms):
+        self._sim_worker = None
         self.simulate_btn.setEnabled(True)
         self.simulate_btn.setText("▶ Simulate")
-
         self.display_results(data, duration_ms)
 
+    def _e_rate_trace(self, data, duration_ms):
+        """E-population rate trace: monitor data when recorded, else binned spikes."""
+        rates = data['rates']
+        if 'E' in rates.get('names', ()) and rates['values'].shape[1] > 0:
+            return rates['times'], rates['values'][rates['names'].index('E')]
+
+        spikes = data['spikes'].get('E')
+        if spikes is None or len(spikes['times']) == 0:
+            return None
+        bin_ms = 1.0
+        counts = bin_spikes(spikes['times'], 0.0, duration_ms, bin_ms)
+        n_exc = getattr(self.current_network, 'n_exc', 1)
+        rates = counts * (1000.0 / (bin_ms * n_exc))
+        times = (np.arange(len(counts)) + 0.5) * bin_ms
+        return times, rates
+
     def display_results(self, data, duration_ms):
-        self.setup_plots()
+        self._clear_dynamic()
         colors = {'E': '#3498db', 'PV': '#e74c3c', 'SOM': '#2ecc71'}
 
+        pix_w = max(int(self.ax_raster.bbox.width), 100)
+
         offset = 0
+        sparse_t, sparse_y, sparse_c, sparse_colors = [], [], [], []
+        legend_handles = []
         for group_name, spike_data in data['spikes'].items():
-            times, indices = spike_data['times'], spike_data['indices']
-            if len(times) > 0:
-                self.ax_raster.scatter(times, indices + offset, s=0.5, c=colors.get(group_name, 'white'), label=group_name)
+            times, indices = _as_display_dtypes(spike_data)
+            color = colors.get(group_name, '#2d3436')
             n = getattr(self.current_network, f'n_{group_name.lower()}', getattr(self.current_network, 'n_exc', 80) if group_name == 'E' else 20)
+            if len(times) > 4 * pix_w:
+                # more spikes than pixel columns: bin to the pixel grid and
+                # draw one image instead of tens of thousands of glyphs
+                H, _, _ = np.histogram2d(
+                    offset_indices(indices, offset), times,
+                    bins=(max(n, 1), pix_w),
+                    range=[[offset, offset + n], [0, duration_ms]])
+                self._dynamic_artists.append(self.ax_raster.imshow(
+                    H > 0, aspect='auto', origin='lower', interpolation='nearest',
+                    extent=[0, duration_ms, offset, offset + n],
+                    cmap=ListedColormap([(0, 0, 0, 0), color])))
+            elif len(times) > 0:
+                # collect sparse groups and draw them in one PathCollection below
+                sparse_t.append(times)
+                sparse_y.append(offset_indices(indices, offset))
+                sparse_c.append(np.full(len(times), len(sparse_colors), dtype=np.int8))
+                sparse_colors.append(color)
+            if len(times) > 0:
+                legend_handles.append(Line2D([], [], marker='s', linestyle='',
+                                             color=color, label=group_name))
             offset += n
 
+        if sparse_t:
+            self._dynamic_artists.append(self.ax_raster.scatter(
+                np.concatenate(sparse_t), np.concatenate(sparse_y), s=0.5,
+                c=np.concatenate(sparse_c), cmap=ListedColormap(sparse_colors),
+                vmin=-0.5, vmax=len(sparse_colors) - 0.5))
+
         self.ax_raster.set_xlim(0, duration_ms)
         self.ax_raster.set_ylim(-1, offset + 1)
-        self.ax_raster.legend(loc='upper right', facecolor='#ffffff', labelcolor='#2d3436', fontsize=8)
-
-        if 'E' in data['rates'] and len(data['rates']['E']['rates']) > 10:
-            times, rates = data['rates']['E']['times'], data['rates']['E']['rates']
-            kernel = np.ones(min(50, len(rates)//10)) / min(50, len(rates)//10)
-            rates_smooth = np.convolve(rates, kernel, mode='same') if len(kernel) > 1 else rates
-            self.ax_rate.plot(times, rates_smooth, color='#e67e22', linewidth=1)
+        self.ax_raster.legend(handles=legend_handles, loc='upper right',
+                              facecolor='#ffffff', labelcolor='#2d3436', fontsize=8)
+
+        e_trace = self._e_rate_trace(data, duration_ms)
+        if e_trace is not None and len(e_trace[1]) > 10:
+            times, rates = e_trace
+            if len(self._smooth_buf) < len(rates):
+                self._smooth_buf = np.empty(len(rates))
+            rates_smooth = smooth_rates_into(np.asarray(rates, dtype=np.float64),
+                                             min(50, len(rates)//10),
+                                             self._smooth_buf[:len(rates)])
+            self._dynamic_artists.extend(
+                self.ax_rate.plot(times, rates_smooth, color='#e67e22', linewidth=1))
             self.ax_rate.set_xlim(0, duration_ms)
             self.ax_rate.set_ylim(0, max(rates_smooth) * 1.2 + 10)
 
-        if 'E' in data['rates'] and len(data['rates']['E']['rates']) > 100:
-            rates, times = data['rates']['E']['rates'], data['rates']['E']['times']
-            dt = np.mean(np.diff(times)) / 1000
+        if e_trace is not None and len(e_trace[1]) > 100:
+            times, rates = e_trace
+            # sampling is uniform, so the endpoints give dt without an O(N) diff
+            dt = (times[-1] - times[0]) / (len(times) - 1) / 1000.0
             if dt > 0:
                 fs = 1 / dt
-                nperseg = 100 * min(1024, len(rates) // 2)
+                # aim for ~0.25 Hz bins but keep nperseg a power of two so
+                # pocketfft stays on its radix-2 fast path
+                nperseg = min(int(fs / 0.25), len(rates) // 2)
+                nperseg = 1 << max(nperseg.bit_length() - 1, 1)
                 if nperseg > 10:
-                    freqs, psd = signal.welch(rates, fs, nperseg=nperseg)
-
-                    mask = freqs <= 100
-                    self.ax_spectrum.fill_between(freqs[mask], psd[mask], color='#f39c12', alpha=0.7)
-                    if len(psd[mask]) > 0:
-                        self.ax_spectrum.set_ylim(0, np.max(psd[mask]) * 1.2 + 0.01)
-                        peak_idx = np.argmax(psd[mask])
-                        self.ax_spectrum.annotate(f'Peak: {freqs[mask][peak_idx]:.1f} Hz',
-                                                   xy=(freqs[mask][peak_idx], psd[mask][peak_idx]),
-                                                   xytext=(freqs[mask][peak_idx] + 15, psd[mask][peak_idx] * 0.8),
-                                                   color='#2d3436', fontsize=9,
-                                                   arrowprops=dict(arrowstyle='->', color='#2d3436'))
+                    win = self._welch_cache.get(nperseg)
+                    if win is None:
+                        win = signal.windows.hann(nperseg, sym=False)
+                        self._welch_cache[nperseg] = win
+                    with set_workers(-1):
+                        # detrending is cosmetic for a display-only PSD and costs a
+                        # full pass per segment — leave it off
+                        freqs, psd = signal.welch(rates, fs, window=win, nperseg=nperseg,
+                                                  noverlap=nperseg // 2, detrend=False,
+                                                  scaling='density', return_onesided=True)
+
+                    # freqs are uniform from 0, so the 100 Hz cut is just an index
+                    df = fs / nperseg
+                    k = min(int(np.ceil(100.0 / df)) + 1, len(freqs))
+                    f, p = freqs[:k], psd[:k]
+                    fill = self.ax_spectrum.fill_between(f, p, color='#f39c12', alpha=0.7)
+                    fill.set_animated(True)
+                    self._dynamic_artists.append(fill)
+                    self._spectrum_artists.append(fill)
+                    if len(p) > 0:
+                        self.ax_spectrum.set_ylim(0, np.max(p) * 1.2 + 0.01)
+                        peak_idx = np.argmax(p)
+                        annot = self.ax_spectrum.annotate(
+                            f'Peak: {f[peak_idx]:.1f} Hz',
+                            xy=(f[peak_idx], p[peak_idx]),
+                            xytext=(f[peak_idx] + 15, p[peak_idx] * 0.8),
+                            color='#2d3436', fontsize=9,
+                            arrowprops=dict(arrowstyle='->', color='#2d3436'))
+                        annot.set_animated(True)
+                        self._dynamic_artists.append(annot)
+                        self._spectrum_artists.append(annot)
 
         self.canvas.refresh()
@@ -1,14 +1,81 @@
+import io
+from dataclasses import dataclass
+
 import numpy as np
-from collections import deque
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider,
-    QLabel, QGroupBox, QStackedWidget, QComboBox, QSizePolicy, QApplication
+    QLabel, QGroupBox, QStackedWidget, QComboBox, QSizePolicy
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QPixmap
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-from src.neurons.single_neuron import NeuronExplorer, NEURON_PRESETS
+from src.neurons.single_neuron import NeuronExplorer, BatchedNeuronExplorer
 from src.gui.canvas import MplCanvas
+from src.gui.trace_buffer import TraceBuffer
+from src.gui._fast import decimate_minmax, isi_stats
+
+# one shared color table instead of per-method literals
+NEURON_COLORS = {'E': '#3498db', 'PV': '#e74c3c', 'SOM': '#2ecc71'}
+
+# layout of Challenge.solution vectors
+_SOLUTION_ORDER = ('a', 'b', 'V_r', 'tau_w', 'current',
+                   'C', 'g_L', 'E_L', 'V_T', 'Delta_T')
+
+
+@dataclass(slots=True)
+class Challenge:
+    name: str
+    description: str
+    hint: str
+    solution: np.ndarray  # values in _SOLUTION_ORDER
+
+# single stylesheet keyed by objectName: one CSS parse for the whole page
+# instead of one per widget (info_label keeps inline styles — it changes
+# color with simulation state)
+_EXPLORER_CSS = """
+QPushButton#back_btn { background-color: #dfe4ea; color: #2d3436; padding: 8px 16px; border-radius: 5px; }
+QPushButton#compare_btn { background-color: #9b59b6; color: white; padding: 8px 16px; border-radius: 5px; }
+QPushButton#compare_btn:checked { border: 2px solid #2d3436; }
+QPushButton#challenge_btn { background-color: #e67e22; color: white; padding: 8px 16px; border-radius: 5px; }
+QPushButton#challenge_btn:checked { border: 2px solid #2d3436; }
+QLabel#title_label { color: #2d3436; }
+QLabel#compare_desc { color: #636e72; font-style: italic; margin: 5px; }
+QLabel#challenge_select_label { color: #2d3436; }
+QComboBox#challenge_combo { background-color: #dfe4ea; color: #2d3436; padding: 8px; border-radius: 5px; }
+QPushButton#solution_btn { background-color: #f39c12; color: white; padding: 8px 16px; border-radius: 5px; }
+QLabel#challenge_desc { color: #e67e22; padding: 10px; background-color: #ffeaa7; border-radius: 5px; }
+QGroupBox#current_box { color: #2d3436; border: 1px solid #3498db; border-radius: 5px; padding: 10px; font-weight: bold; }
+QLabel#current_label { color: #2980b9; font-size: 14px; font-weight: bold; min-width: 120px; }
+QGroupBox#challenge_params_box { color: #2d3436; border: 1px solid #e67e22; border-radius: 5px; padding: 10px; }
+QLabel#param_label { color: #2d3436; font-size: 10px; }
+QGroupBox#eq_box { color: #2d3436; border: 1px solid #b2bec3; border-radius: 5px; padding: 5px; }
+QLabel#eq_params_label { color: #2980b9; font-family: monospace; font-size: 10px; padding: 5px; }
+QPushButton#start_btn { background-color: #27ae60; color: white; padding: 10px 30px; border-radius: 5px; font-weight: bold; }
+QPushButton#reset_btn { background-color: #e74c3c; color: white; padding: 10px 30px; border-radius: 5px; }
+QPushButton#continue_btn { background-color: #9b59b6; color: white; padding: 15px 30px; border-radius: 5px; font-weight: bold; font-size: 14px; }
+QPushButton#continue_to_network_btn { background-color: #3498db; color: white; padding: 15px 30px; border-radius: 5px; font-weight: bold; font-size: 14px; }
+"""
+
+
+class _ChallengeSignals(QObject):
+    done = pyqtSignal(dict)
+
+
+class _ChallengeWorker(QRunnable):
+    """Runs the challenge simulation off the GUI thread."""
+
+    def __init__(self, sim, duration_ms):
+        super().__init__()
+        self.sim = sim
+        self.duration_ms = duration_ms
+        self.signals = _ChallengeSignals()
+
+    def run(self):
+        self.signals.done.emit(self.sim.run_step(duration_ms=self.duration_ms))
 
 
 class NeuronExplorerWidget(QWidget):
@@ -18,96 +85,85 @@ class NeuronExplorerWidget(QWidget):
         self.on_complete = on_complete
         self.on_menu = on_menu
 
-        self.simulations = {
-            'E': NeuronExplorer(),
-            'PV': NeuronExplorer(),
-            'SOM': NeuronExplorer()
-        }
-        self.simulations['E'].set_preset('regular_spiking')
-        self.simulations['PV'].set_preset('fast_spiking')
-        self.simulations['SOM'].set_preset('low_threshold')
+        # all three compare neurons live in one batched network so each
+        # frame pays Brian2's run overhead once instead of three times
+        self.simulations = BatchedNeuronExplorer({
+            'E': 'regular_spiking',
+            'PV': 'fast_spiking',
+            'SOM': 'low_threshold',
+        })
 
         self.is_running = False
         self.window_ms = 500
-        self.voltage_buffers = {k: deque(maxlen=5000) for k in self.simulations}
-        self.time_buffers = {k: deque(maxlen=5000) for k in self.simulations}
+        self.trace_buffers = {k: TraceBuffer(5000) for k in self.simulations.keys}
 
         self.challenge_mode = False
         self.current_challenge = None
         self.challenges = {
-            'tonic': {
-                'name': 'Tonic Spiking',
-                'description': 'Create sustained regular firing with no adaptation. Constant ISI.',
-                'hint': 'Set a=0 (no subthreshold adaptation), moderate b, fast τw...',
-                'solution': {
-                    'a': 0.0, 'b': 60.0, 'V_r': -55.0, 'tau_w': 30.0,
-                    'current': 120.0, 'C': 40.0, 'g_L': 2.0, 'E_L': -70.0,
-                    'V_T': -50.0, 'Delta_T': 2.0
-                }
-            },
-            'adapting': {
-                'name': 'Adapting Neuron',
-                'description': 'Create an ADAPTING pattern: starts fast, gradually slows down over time',
-                'hint': 'Set a=0 (no subthreshold adaptation), small b, and slow τw to accumulate adaptation...',
-                'solution': {
-                    'a': 0.0, 'b': 5.0, 'V_r': -55.0, 'tau_w': 210.0,
-                    'current': 120.0, 'C': 40.0, 'g_L': 2.0, 'E_L': -70.0,
-                    'V_T': -50.0, 'Delta_T': 2.0
-                }
-            },
-            'bursting': {
-                'name': 'Bursting Neuron',
-                'description': 'Create RHYTHMIC BURSTS: groups of spikes separated by silent periods',
-                'hint': 'Key insight: negative a makes w regenerative! Also raise V_r close to threshold...',
-                'solution': {
-                    'a': -0.5, 'b': 7.0, 'V_r': -46.0, 'tau_w': 100.0,
-                    'current': 120.0, 'C': 10.0, 'g_L': 2.0, 'E_L': -70.0,
-                    'V_T': -50.0, 'Delta_T': 2.0
-                }
-            },
-            'irregular': {
-                'name': 'Irregular/Chaotic',
-                'description': 'Create IRREGULAR firing with variable inter-spike intervals',
-                'hint': 'Negative a combined with high V_r creates chaotic dynamics near bifurcation...',
-                'solution': {
-                    'a': -0.5, 'b': 7.0, 'V_r': -46.0, 'tau_w': 100.0,
-                    'current': 120.0, 'C': 20.0, 'g_L': 2.0, 'E_L': -70.0,
-                    'V_T': -50.0, 'Delta_T': 2.0
-                }
-            },
+            'tonic': Challenge(
+                name='Tonic Spiking',
+                description='Create sustained regular firing with no adaptation. Constant ISI.',
+                hint='Set a=0 (no subthreshold adaptation), moderate b, fast τw...',
+                solution=np.array([0.0, 60.0, -55.0, 30.0, 120.0,
+                                   40.0, 2.0, -70.0, -50.0, 2.0]),
+            ),
+            'adapting': Challenge(
+                name='Adapting Neuron',
+                description='Create an ADAPTING pattern: starts fast, gradually slows down over time',
+                hint='Set a=0 (no subthreshold adaptation), small b, and slow τw to accumulate adaptation...',
+                solution=np.array([0.0, 5.0, -55.0, 210.0, 120.0,
+                                   40.0, 2.0, -70.0, -50.0, 2.0]),
+            ),
+            'bursting': Challenge(
+                name='Bursting Neuron',
+                description='Create RHYTHMIC BURSTS: groups of spikes separated by silent periods',
+                hint='Key insight: negative a makes w regenerative! Also raise V_r close to threshold...',
+                solution=np.array([-0.5, 7.0, -46.0, 100.0, 120.0,
+                                   10.0, 2.0, -70.0, -50.0, 2.0]),
+            ),
+            'irregular': Challenge(
+                name='Irregular/Chaotic',
+                description='Create IRREGULAR firing with variable inter-spike intervals',
+                hint='Negative a combined with high V_r creates chaotic dynamics near bifurcation...',
+                solution=np.array([-0.5, 7.0, -46.0, 100.0, 120.0,
+                                   20.0, 2.0, -70.0, -50.0, 2.0]),
+            ),
         }
 
         self.init_ui()
 
     def init_ui(self):
+        self.setStyleSheet(_EXPLORER_CSS)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(5)
+        self._main_layout = layout
 
         header = QHBoxLayout()
         back_btn = QPushButton("← Menu")
+        back_btn.setObjectName("back_btn")
         back_btn.clicked.connect(self.on_menu)
-        back_btn.setStyleSheet("background-color: #dfe4ea; color: #2d3436; padding: 8px 16px; border-radius: 5px;")
         header.addWidget(back_btn)
         header.addStretch()
 
         self.compare_btn = QPushButton("Compare Mode")
+        self.compare_btn.setObjectName("compare_btn")
         self.compare_btn.setCheckable(True)
         self.compare_btn.setChecked(True)
         self.compare_btn.clicked.connect(lambda: self.set_mode(False))
-        self.compare_btn.setStyleSheet("QPushButton { background-color: #9b59b6; color: white; padding: 8px 16px; border-radius: 5px; } QPushButton:checked { border: 2px solid #2d3436; }")
         header.addWidget(self.compare_btn)
 
         self.challenge_btn = QPushButton("Challenge Mode")
+        self.challenge_btn.setObjectName("challenge_btn")
         self.challenge_btn.setCheckable(True)
         self.challenge_btn.clicked.connect(lambda: self.set_mode(True))
-        self.challenge_btn.setStyleSheet("QPushButton { background-color: #e67e22; color: white; padding: 8px 16px; border-radius: 5px; } QPushButton:checked { border: 2px solid #2d3436; }")
         header.addWidget(self.challenge_btn)
 
         layout.addLayout(header)
 
         title = QLabel("Part 2: Neuron Explorer")
+        title.setObjectName("title_label")
         title.setFont(QFont('Arial', 18, QFont.Weight.Bold))
-        title.setStyleSheet("color: #2d3436;")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -118,7 +174,7 @@ class NeuronExplorerWidget(QWidget):
         compare_layout.setContentsMargins(0, 0, 0, 0)
 
         compare_desc = QLabel("Compare how E (Excitatory), PV (Fast-Spiking), and SOM (Adapting) neurons respond to the same input!")
-        compare_desc.setStyleSheet("color: #636e72; font-style: italic; margin: 5px;")
+        compare_desc.setObjectName("compare_desc")
         compare_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         compare_layout.addWidget(compare_desc)
 
@@ -126,33 +182,129 @@ class NeuronExplorerWidget(QWidget):
         compare_layout.addWidget(self.compare_canvas)
 
         self.mode_stack.addWidget(compare_widget)
+        layout.addWidget(self.mode_stack)
+
+        # the challenge page (canvas, nine sliders, labels) is built on
+        # first use in _build_challenge_ui; compare-only sessions never
+        # pay for it
+        self._challenge_built = False
+
+        current_box = QGroupBox("Input Current (same for all neurons)")
+        current_box.setObjectName("current_box")
+        current_layout = QHBoxLayout(current_box)
+
+        self.current_label = QLabel("Current: 0 pA")
+        self.current_label.setObjectName("current_label")
+        current_layout.addWidget(self.current_label)
+
+        self.current_slider = QSlider(Qt.Orientation.Horizontal)
+        self.current_slider.setRange(0, 5000)
+        self.current_slider.setValue(0)
+        self.current_slider.valueChanged.connect(self.on_current_changed)
+        current_layout.addWidget(self.current_slider)
+        layout.addWidget(current_box)
+
+        # the lazily built challenge_params_box slots in right after the
+        # current box
+        self._params_box_index = layout.count()
+
+        eq_box = QGroupBox("AdEx Neuron Model")
+        eq_box.setObjectName("eq_box")
+        eq_layout = QVBoxLayout(eq_box)
+
+        self.eq_label = QLabel()
+        self.eq_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        eq_layout.addWidget(self.eq_label)
+
+        self.eq_params_label = QLabel()
+        self.eq_params_label.setObjectName("eq_params_label")
+        self.eq_params_label.setWordWrap(True)
+        eq_layout.addWidget(self.eq_params_label)
+
+        self.render_latex_equations()
+
+        layout.addWidget(eq_box)
+
+        btn_layout = QHBoxLayout()
+        self.start_btn = QPushButton("Start")
+        self.start_btn.setObjectName("start_btn")
+        self.start_btn.clicked.connect(self.toggle_simulation)
+        btn_layout.addWidget(self.start_btn)
+
+        self.reset_btn = QPushButton("Reset")
+        self.reset_btn.setObjectName("reset_btn")
+        self.reset_btn.clicked.connect(self.reset_simulation)
+        btn_layout.addWidget(self.reset_btn)
+
+        btn_layout.addStretch()
+        layout.addLayout(btn_layout)
 
+        self.info_label = QLabel("Adjust the input current and watch how each neuron type responds differently!")
+        self.info_label.setStyleSheet("color: #e67e22; padding: 10px; background-color: #ffeaa7; border-radius: 5px;")
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        self.continue_btn = QPushButton("Continue to Challenge Mode →")
+        self.continue_btn.setObjectName("continue_btn")
+        self.continue_btn.clicked.connect(self.go_to_challenge_mode)
+        layout.addWidget(self.continue_btn)
+
+        self.continue_to_network_btn = QPushButton("Continue to Network Lab →")
+        self.continue_to_network_btn.setObjectName("continue_to_network_btn")
+        self.continue_to_network_btn.clicked.connect(self.on_complete)
+        self.continue_to_network_btn.hide()
+        layout.addWidget(self.continue_to_network_btn)
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_simulation)
+
+        # the paint timer runs at its own ~30 Hz cadence so a slow
+        # simulation step cannot starve the UI of repaints
+        self._needs_repaint = False
+        self._paint_timer = QTimer()
+        self._paint_timer.timeout.connect(self._repaint)
+
+        # coalesce slider ticks: labels update immediately, but the
+        # simulation setters run once per frame with the latest values
+        self._pending_params = {}
+        self._coalesce = QTimer()
+        self._coalesce.setSingleShot(True)
+        self._coalesce.setInterval(16)
+        self._coalesce.timeout.connect(self._apply_pending_params)
+
+        self.challenge_sim = NeuronExplorer()
+        self.challenge_trace = TraceBuffer(5000)
+
+        self.setup_compare_plots()
+        self.compare_canvas.mpl_connect('draw_event', self._on_compare_draw)
+
+    def _build_challenge_ui(self):
         challenge_widget = QWidget()
         challenge_layout = QVBoxLayout(challenge_widget)
         challenge_layout.setContentsMargins(0, 0, 0, 0)
 
         challenge_selector = QHBoxLayout()
         challenge_label = QLabel("Select Challenge:")
-        challenge_label.setStyleSheet("color: #2d3436;")
+        challenge_label.setObjectName("challenge_select_label")
         challenge_selector.addWidget(challenge_label)
 
         self.challenge_combo = QComboBox()
         self.challenge_combo.addItem("Make it Burst!", "bursting")
         self.challenge_combo.addItem("Tonic Neuron", "tonic")
         self.challenge_combo.addItem("Adapting Pattern", "adapting")
+        self.challenge_combo.setObjectName("challenge_combo")
         self.challenge_combo.currentIndexChanged.connect(self.on_challenge_changed)
-        self.challenge_combo.setStyleSheet("background-color: #dfe4ea; color: #2d3436; padding: 8px; border-radius: 5px;")
         challenge_selector.addWidget(self.challenge_combo)
         challenge_selector.addStretch()
 
         self.solution_btn = QPushButton("Show Solution")
+        self.solution_btn.setObjectName("solution_btn")
         self.solution_btn.clicked.connect(self.show_solution)
-        self.solution_btn.setStyleSheet("background-color: #f39c12; color: white; padding: 8px 16px; border-radius: 5px;")
         challenge_selector.addWidget(self.solution_btn)
         challenge_layout.addLayout(challenge_selector)
 
-        self.challenge_desc = QLabel(self.challenges['bursting']['description'])
-        self.challenge_desc.setStyleSheet("color: #e67e22; padding: 10px; background-color: #ffeaa7; border-radius: 5px;")
+        self.challenge_desc = QLabel(self.challenges['bursting'].description)
+        self.challenge_desc.setObjectName("challenge_desc")
         self.challenge_desc.setWordWrap(True)
         challenge_layout.addWidget(self.challenge_desc)
 
@@ -160,25 +312,9 @@ class NeuronExplorerWidget(QWidget):
         challenge_layout.addWidget(self.challenge_canvas)
 
         self.mode_stack.addWidget(challenge_widget)
-        layout.addWidget(self.mode_stack)
-
-        current_box = QGroupBox("Input Current (same for all neurons)")
-        current_box.setStyleSheet("QGroupBox { color: #2d3436; border: 1px solid #3498db; border-radius: 5px; padding: 10px; font-weight: bold; }")
-        current_layout = QHBoxLayout(current_box)
-
-        self.current_label = QLabel("Current: 0 pA")
-        self.current_label.setStyleSheet("color: #2980b9; font-size: 14px; font-weight: bold; min-width: 120px;")
-        current_layout.addWidget(self.current_label)
-
-        self.current_slider = QSlider(Qt.Orientation.Horizontal)
-        self.current_slider.setRange(0, 5000)
-        self.current_slider.setValue(0)
-        self.current_slider.valueChanged.connect(self.on_current_changed)
-        current_layout.addWidget(self.current_slider)
-        layout.addWidget(current_box)
 
         self.challenge_params_box = QGroupBox("AdEx Parameters (adjust to complete the challenge)")
-        self.challenge_params_box.setStyleSheet("QGroupBox { color: #2d3436; border: 1px solid #e67e22; border-radius: 5px; padding: 10px; }")
+        self.challenge_params_box.setObjectName("challenge_params_box")
         params_layout = QHBoxLayout(self.challenge_params_box)
 
         self.param_sliders = {}
@@ -199,7 +335,7 @@ class NeuronExplorerWidget(QWidget):
         for name, label, min_v, max_v, default in param_configs:
             col = QVBoxLayout()
             lbl = QLabel(f"{label}")
-            lbl.setStyleSheet("color: #2d3436; font-size: 10px;")
+            lbl.setObjectName("param_label")
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.param_labels[name] = lbl
             col.addWidget(lbl)
@@ -213,63 +349,10 @@ class NeuronExplorerWidget(QWidget):
             params_layout.addLayout(col)
 
         self.challenge_params_box.hide()
-        layout.addWidget(self.challenge_params_box)
-
-        eq_box = QGroupBox("AdEx Neuron Model")
-        eq_box.setStyleSheet("QGroupBox { color: #2d3436; border: 1px solid #b2bec3; border-radius: 5px; padding: 5px; }")
-        eq_layout = QVBoxLayout(eq_box)
-
-        self.eq_canvas = MplCanvas(self, width=10, height=3.2, dpi=100)
-        self.eq_canvas.fig.set_facecolor('#f5f6fa')
-        self.render_latex_equations()
-        eq_layout.addWidget(self.eq_canvas)
-
-        self.eq_params_label = QLabel()
-        self.eq_params_label.setStyleSheet("color: #2980b9; font-family: monospace; font-size: 10px; padding: 5px;")
-        self.eq_params_label.setWordWrap(True)
-        eq_layout.addWidget(self.eq_params_label)
-
-        layout.addWidget(eq_box)
-
-        btn_layout = QHBoxLayout()
-        self.start_btn = QPushButton("Start")
-        self.start_btn.clicked.connect(self.toggle_simulation)
-        self.start_btn.setStyleSheet("background-color: #27ae60; color: white; padding: 10px 30px; border-radius: 5px; font-weight: bold;")
-        btn_layout.addWidget(self.start_btn)
-
-        self.reset_btn = QPushButton("Reset")
-        self.reset_btn.clicked.connect(self.reset_simulation)
-        self.reset_btn.setStyleSheet("background-color: #e74c3c; color: white; padding: 10px 30px; border-radius: 5px;")
-        btn_layout.addWidget(self.reset_btn)
-
-        btn_layout.addStretch()
-        layout.addLayout(btn_layout)
-
-        self.info_label = QLabel("Adjust the input current and watch how each neuron type responds differently!")
-        self.info_label.setStyleSheet("color: #e67e22; padding: 10px; background-color: #ffeaa7; border-radius: 5px;")
-        self.info_label.setWordWrap(True)
-        layout.addWidget(self.info_label)
-
-        self.continue_btn = QPushButton("Continue to Challenge Mode →")
-        self.continue_btn.clicked.connect(self.go_to_challenge_mode)
-        self.continue_btn.setStyleSheet("background-color: #9b59b6; color: white; padding: 15px 30px; border-radius: 5px; font-weight: bold; font-size: 14px;")
-        layout.addWidget(self.continue_btn)
-
-        self.continue_to_network_btn = QPushButton("Continue to Network Lab →")
-        self.continue_to_network_btn.clicked.connect(self.on_complete)
-        self.continue_to_network_btn.setStyleSheet("background-color: #3498db; color: white; padding: 15px 30px; border-radius: 5px; font-weight: bold; font-size: 14px;")
-        self.continue_to_network_btn.hide()
-        layout.addWidget(self.continue_to_network_btn)
-
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_simulation)
+        self._main_layout.insertWidget(self._params_box_index, self.challenge_params_box)
 
-        self.challenge_sim = NeuronExplorer()
-        self.challenge_voltage_buffer = deque(maxlen=5000)
-        self.challenge_time_buffer = deque(maxlen=5000)
-
-        self.setup_compare_plots()
         self.setup_challenge_plots()
+        self._challenge_built = True
 
     def set_mode(self, challenge_mode):
         self.challenge_mode = challenge_mode
@@ -277,6 +360,8 @@ class NeuronExplorerWidget(QWidget):
         self.challenge_btn.setChecked(challenge_mode)
 
         if challenge_mode:
+            if not self._challenge_built:
+                self._build_challenge_ui()
             self.mode_stack.setCurrentIndex(1)
             self.challenge_params_box.show()
             self.info_label.setText("Adjust the parameters and click Run to see the firing pattern!")
@@ -287,7 +372,8 @@ class NeuronExplorerWidget(QWidget):
             self.is_running = False
         else:
             self.mode_stack.setCurrentIndex(0)
-            self.challenge_params_box.hide()
+            if self._challenge_built:
+                self.challenge_params_box.hide()
             self.info_label.setText("Adjust the input current and watch how each neuron type responds differently!")
             self.continue_btn.show()
             self.continue_to_network_btn.hide()
@@ -302,69 +388,69 @@ class NeuronExplorerWidget(QWidget):
         challenge_key = self.challenge_combo.currentData()
         self.current_challenge = challenge_key
         challenge = self.challenges[challenge_key]
-        self.challenge_desc.setText(f"{challenge['description']}\n\nHint: {challenge['hint']}")
+        self.challenge_desc.setText(f"{challenge.description}\n\nHint: {challenge.hint}")
         self.reset_simulation()
 
     def show_solution(self):
         if self.current_challenge is None:
             self.current_challenge = 'bursting'
 
-        solution = self.challenges[self.current_challenge]['solution']
+        challenge = self.challenges[self.current_challenge]
 
-        self.param_sliders['a'].setValue(int(solution['a'] * 10))
-        self.param_sliders['b'].setValue(int(solution['b']))
-        self.param_sliders['V_r'].setValue(int(solution['V_r']))
-        self.param_sliders['C'].setValue(int(solution['C']))
-        self.param_sliders['g_L'].setValue(int(solution['g_L']))
-        self.param_sliders['E_L'].setValue(int(solution['E_L']))
-        self.param_sliders['V_T'].setValue(int(solution['V_T']))
-        self.param_sliders['Delta_T'].setValue(int(solution['Delta_T'] * 10))
-        self.param_sliders['tau_w'].setValue(int(solution['tau_w'] / 10))
-        self.current_slider.setValue(int(solution['current'] * 10))
+        # move every slider with signals blocked, then write the solution
+        # to the simulator once instead of ten valueChanged round trips
+        for name, value in zip(_SOLUTION_ORDER, challenge.solution):
+            if name == 'current':
+                with QSignalBlocker(self.current_slider):
+                    self.current_slider.setValue(int(value * 10))
+            else:
+                with QSignalBlocker(self.param_sliders[name]):
+                    self.param_sliders[name].setValue(
+                        round(value / self._PARAM_META[name][0]))
+        self._apply_solution(challenge.solution)
 
-        self.info_label.setText(f"Solution applied! Watch the {self.challenges[self.current_challenge]['name']} pattern.")
+        self.info_label.setText(f"Solution applied! Watch the {challenge.name} pattern.")
         self.info_label.setStyleSheet("color: #27ae60; padding: 10px; background-color: #d5f5e3; border-radius: 5px;")
 
+    # slider int -> model value: (scale, label prefix, unit, value format)
+    _PARAM_META = {
+        'a': (0.1, 'a', 'nS', '{:.1f}'),
+        'b': (1.0, 'b', 'pA', '{:.0f}'),
+        'V_r': (1.0, 'Vr', 'mV', '{:.0f}'),
+        'tau_w': (10.0, 'τw', 'ms', '{:.0f}'),
+        'C': (1.0, 'C', 'pF', '{:.0f}'),
+        'g_L': (1.0, 'gL', 'nS', '{:.0f}'),
+        'E_L': (1.0, 'EL', 'mV', '{:.0f}'),
+        'V_T': (1.0, 'VT', 'mV', '{:.0f}'),
+        'Delta_T': (0.1, 'ΔT', 'mV', '{:.1f}'),
+    }
+
+    def _apply_solution(self, solution):
+        for name, value in zip(_SOLUTION_ORDER, solution):
+            if name == 'current':
+                self.current_label.setText(f"Current: {value:.1f}")
+                self.simulations.set_input_current(value)
+                self.challenge_sim.set_input_current(value)
+            else:
+                scale, prefix, unit, fmt = self._PARAM_META[name]
+                self.challenge_sim.set_parameter(name, value)
+                self.param_labels[name].setText(f"{prefix}: {fmt.format(value)} {unit}")
+
     def on_challenge_param_changed(self, name, value):
-        if name == 'a':
-            actual_value = value / 10.0
-            self.challenge_sim.set_parameter('a', actual_value)
-            self.param_labels[name].setText(f"a: {actual_value:.1f} nS")
-        elif name == 'b':
-            actual_value = value
-            self.challenge_sim.set_parameter('b', actual_value)
-            self.param_labels[name].setText(f"b: {actual_value:.0f} pA")
-        elif name == 'V_r':
-            self.challenge_sim.set_parameter('V_r', value)
-            self.param_labels[name].setText(f"Vr: {value} mV")
-        elif name == 'tau_w':
-            actual_value = value * 10.0
-            self.challenge_sim.set_parameter('tau_w', actual_value)
-            self.param_labels[name].setText(f"τw: {actual_value:.0f} ms")
-        elif name == 'C':
-            self.challenge_sim.set_parameter('C', value)
-            self.param_labels[name].setText(f"C: {value} pF")
-        elif name == 'g_L':
-            self.challenge_sim.set_parameter('g_L', value)
-            self.param_labels[name].setText(f"gL: {value} nS")
-        elif name == 'E_L':
-            self.challenge_sim.set_parameter('E_L', value)
-            self.param_labels[name].setText(f"EL: {value} mV")
-        elif name == 'V_T':
-            self.challenge_sim.set_parameter('V_T', value)
-            self.param_labels[name].setText(f"VT: {value} mV")
-        elif name == 'Delta_T':
-            actual_value = value / 10.0
-            self.challenge_sim.set_parameter('Delta_T', actual_value)
-            self.param_labels[name].setText(f"ΔT: {actual_value:.1f} mV")
+        scale, prefix, unit, fmt = self._PARAM_META[name]
+        actual_value = value * scale
+        self.param_labels[name].setText(f"{prefix}: {fmt.format(actual_value)} {unit}")
+        self._pending_params[name] = actual_value
+        self._coalesce.start()
 
     def render_latex_equations(self):
-        self.eq_canvas.fig.clear()
-        self.eq_canvas.fig.set_facecolor('#f5f6fa')
+        # the equations never change: rasterize the mathtext once to a
+        # pixmap instead of keeping a live Agg canvas in the layout
+        fig = Figure(figsize=(6.5, 2.0), dpi=100)
+        FigureCanvasAgg(fig)
+        fig.set_facecolor('#f5f6fa')
 
-        gs = self.eq_canvas.fig.add_gridspec(1, 2, width_ratios=[1.2, 1], wspace=0.05)
-
-        ax_eq = self.eq_canvas.fig.add_subplot(gs[0, 0])
+        ax_eq = fig.add_subplot(111)
         ax_eq.set_facecolor('#f5f6fa')
         ax_eq.axis('off')
 
@@ -386,24 +472,22 @@ class NeuronExplorerWidget(QWidget):
             family='serif'
         )
 
-        ax_params = self.eq_canvas.fig.add_subplot(gs[0, 1])
-        ax_params.set_facecolor('#f5f6fa')
-        ax_params.axis('off')
-
-        colors = {'E': '#3498db', 'PV': '#e74c3c', 'SOM': '#2ecc71'}
-        y_positions = [0.85, 0.55, 0.25]
-
-        for idx, (key, sim) in enumerate(self.simulations.items()):
-            color = colors[key]
-            y = y_positions[idx]
-            ax_params.text(0.05, y, f"{key}:", transform=ax_params.transAxes,
-                          fontsize=10, color=color, fontweight='bold', va='center')
-            param_text = f"a={sim.a:.1f}nS  b={sim.b:.0f}pA  τw={sim.tau_w:.0f}ms"
-            ax_params.text(0.25, y, param_text, transform=ax_params.transAxes,
-                          fontsize=9, color=color, va='center', family='monospace')
-
-        self.eq_canvas.fig.tight_layout()
-        self.eq_canvas.draw()
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100, bbox_inches='tight',
+                    facecolor='#f5f6fa')
+        pix = QPixmap()
+        pix.loadFromData(buf.getvalue())
+        self.eq_label.setPixmap(pix)
+
+        parts = []
+        for key, params in self.simulations.params.items():
+            color = NEURON_COLORS[key]
+            parts.append(
+                f'<span style="color:{color};"><b>{key}:</b> '
+                f'a={params["a"]:.1f}nS  b={params["b"]:.0f}pA  '
+                f'τw={params["tau_w"]:.0f}ms</span>'
+            )
+        self.eq_params_label.setText(' &nbsp;|&nbsp; '.join(parts))
 
     def setup_compare_plots(self):
         self.compare_canvas.fig.clear()
@@ -414,9 +498,9 @@ class NeuronExplorerWidget(QWidget):
         self.voltage_lines = {}
 
         neuron_info = {
-            'E': ('Excitatory (E)', '#3498db', 'Regular spiking\nAdaptation'),
-            'PV': ('Fast-Spiking (PV)', '#e74c3c', 'No adaptation\nHigh frequency'),
-            'SOM': ('Adapting (SOM)', '#2ecc71', 'Strong adaptation\nLow threshold')
+            'E': ('Excitatory (E)', NEURON_COLORS['E'], 'Regular spiking\nAdaptation'),
+            'PV': ('Fast-Spiking (PV)', NEURON_COLORS['PV'], 'No adaptation\nHigh frequency'),
+            'SOM': ('Adapting (SOM)', NEURON_COLORS['SOM'], 'Strong adaptation\nLow threshold')
         }
 
         for idx, (key, (title, color, desc)) in enumerate(neuron_info.items()):
@@ -428,8 +512,12 @@ class NeuronExplorerWidget(QWidget):
             ax.tick_params(colors='#2d3436', labelsize=8)
             ax.set_ylim(-80, 40)
             ax.set_xlim(0, self.window_ms)
+            ax.set_autoscale_on(False)
 
-            line, = ax.plot([], [], color=color, linewidth=1)
+            # antialiasing is the bulk of Agg's stroking cost for dense traces;
+            # animated keeps the line out of full draws so it can be blitted
+            line, = ax.plot([], [], color=color, linewidth=1, antialiased=False,
+                            animated=True)
             self.voltage_lines[key] = line
             self.compare_axes[key] = ax
 
@@ -440,8 +528,16 @@ class NeuronExplorerWidget(QWidget):
                 spine.set_color('#b2bec3')
 
         self.compare_canvas.fig.tight_layout()
+        self._compare_bg = None
         self.compare_canvas.draw()
 
+    def _on_compare_draw(self, event):
+        # any full draw (first show, resize, reset) invalidates the cached
+        # per-axes backgrounds, so recapture them for blitting
+        canvas = self.compare_canvas
+        self._compare_bg = {key: canvas.copy_from_bbox(ax.bbox)
+                            for key, ax in self.compare_axes.items()}
+
     def setup_challenge_plots(self):
         self.challenge_canvas.setFixedHeight(200)
         self.challenge_canvas.setSizePolicy(
@@ -459,7 +555,8 @@ class NeuronExplorerWidget(QWidget):
         self.challenge_ax_voltage.tick_params(colors='#2d3436')
         self.challenge_ax_voltage.set_ylim(-80, 40)
         self.challenge_ax_voltage.set_xlim(0, self.window_ms)
-        self.challenge_voltage_line, = self.challenge_ax_voltage.plot([], [], color='#e67e22', linewidth=1.5)
+        self.challenge_ax_voltage.set_autoscale_on(False)
+        self.challenge_voltage_line, = self.challenge_ax_voltage.plot([], [], color='#e67e22', linewidth=1.5, antialiased=False)
         for spine in self.challenge_ax_voltage.spines.values():
             spine.set_color('#b2bec3')
 
@@ -469,39 +566,50 @@ class NeuronExplorerWidget(QWidget):
     def on_current_changed(self, value):
         current = value / 10.0
         self.current_label.setText(f"Current: {current:.1f}")
-
-        for sim in self.simulations.values():
-            sim.set_input_current(current)
-
-        self.challenge_sim.set_input_current(current)
+        self._pending_params['current'] = current
+        self._coalesce.start()
+
+    def _apply_pending_params(self):
+        current = self._pending_params.pop('current', None)
+        if current is not None:
+            self.simulations.set_input_current(current)
+            self.challenge_sim.set_input_current(current)
+        for name, value in self._pending_params.items():
+            self.challenge_sim.set_parameter(name, value)
+        self._pending_params.clear()
 
     def toggle_simulation(self):
         if self.challenge_mode:
             self.run_challenge_simulation()
         else:
             if not self.is_running:
-                for sim in self.simulations.values():
-                    if not sim.is_setup:
-                        sim.setup()
+                self._apply_pending_params()
+                if not self.simulations.is_setup:
+                    self.simulations.setup()
 
                 self.is_running = True
                 self.start_btn.setText("Pause")
                 self.timer.start(50)
+                self._paint_timer.start(33)
             else:
                 self.is_running = False
                 self.start_btn.setText("Start")
                 self.timer.stop()
+                self._paint_timer.stop()
 
     def run_challenge_simulation(self):
+        self._apply_pending_params()
         self.challenge_sim.reset()
-        self.challenge_sim.setup()
 
         self.start_btn.setEnabled(False)
         self.start_btn.setText("Running...")
-        QApplication.processEvents()
 
-        data = self.challenge_sim.run_step(duration_ms=300)
+        worker = _ChallengeWorker(self.challenge_sim, duration_ms=300)
+        worker.signals.done.connect(self._on_challenge_done)
+        self._challenge_worker = worker
+        QThreadPool.globalInstance().start(worker)
 
+    def _on_challenge_done(self, data):
         self.start_btn.setEnabled(True)
         self.start_btn.setText("Run")
 
@@ -511,28 +619,19 @@ class NeuronExplorerWidget(QWidget):
         times = data['time']
         voltages = data['voltage']
 
-        self.challenge_ax_voltage.clear()
-        self.challenge_ax_voltage.set_facecolor('#ffffff')
-        self.challenge_ax_voltage.set_ylabel('Voltage (mV)', color='#2d3436')
-        self.challenge_ax_voltage.tick_params(colors='#2d3436')
-        self.challenge_ax_voltage.set_ylim(-80, 40)
+        # reuse the Line2D from setup_challenge_plots; clearing and
+        # rebuilding the axes each click is the slow Matplotlib path
         self.challenge_ax_voltage.set_xlim(0, 300)
-        self.challenge_ax_voltage.plot(times, voltages, color='#e67e22', linewidth=1.5)
-        for spine in self.challenge_ax_voltage.spines.values():
-            spine.set_color('#b2bec3')
-
-        self.challenge_canvas.fig.tight_layout()
-        self.challenge_canvas.draw()
+        self.challenge_voltage_line.set_data(times, voltages)
+        self.challenge_canvas.draw_idle()
 
         spike_times = data['spike_times']
         n_spikes = len(spike_times)
         if n_spikes > 1:
-            isis = np.diff(spike_times)
-            mean_isi = np.mean(isis)
-            cv_isi = np.std(isis) / mean_isi if mean_isi > 0 else 0
+            mean_isi, cv_isi, has_short_isi = isi_stats(spike_times)
             firing_rate = n_spikes / 0.3
 
-            if cv_isi > 0.5 and np.any(isis < 15):
+            if cv_isi > 0.5 and has_short_isi:
                 pattern = "Bursting detected!"
             elif cv_isi < 0.2:
                 pattern = "Regular spiking"
@@ -549,25 +648,26 @@ class NeuronExplorerWidget(QWidget):
 
     def reset_simulation(self):
         self.timer.stop()
+        self._paint_timer.stop()
+        self._needs_repaint = False
         self.is_running = False
         self.start_btn.setText("Start")
 
-        for key in self.voltage_buffers:
-            self.voltage_buffers[key].clear()
-            self.time_buffers[key].clear()
-        self.challenge_voltage_buffer.clear()
-        self.challenge_time_buffer.clear()
+        for buf in self.trace_buffers.values():
+            buf.clear()
+        self.challenge_trace.clear()
 
-        for sim in self.simulations.values():
-            sim.reset()
+        self.simulations.reset()
         self.challenge_sim.reset()
 
         self.setup_compare_plots()
-        self.setup_challenge_plots()
+        if self._challenge_built:
+            self.setup_challenge_plots()
 
         self.info_label.setStyleSheet("color: #e67e22; padding: 10px; background-color: #ffeaa7; border-radius: 5px;")
 
     def update_simulation(self):
+        """Simulation cadence: advance the models and fill the buffers."""
         if not self.is_running:
             return
 
@@ -576,36 +676,26 @@ class NeuronExplorerWidget(QWidget):
         else:
             self.update_compare_simulation()
 
+    def _ingest(self, buf, data):
+        # display precision: drop to float32 before any slicing so the
+        # dedup/append path never copies float64, then drop samples the
+        # monitor already delivered via a binary search on the monotonic
+        # times instead of a boolean mask plus copies
+        new_times = data['time'].astype(np.float32, copy=False)
+        new_voltages = data['voltage'].astype(np.float32, copy=False)
+        seen = np.searchsorted(new_times, buf.last_time(), side='right')
+        buf.append(new_times[seen:], new_voltages[seen:])
+
     def update_compare_simulation(self):
-        firing_rates = {}
+        results = self.simulations.run_step(duration_ms=50)
 
-        for key, sim in self.simulations.items():
-            data = sim.run_step(duration_ms=50)
+        firing_rates = {}
+        for key, data in results.items():
             if len(data['time']) == 0:
                 continue
-
-            new_times = data['time']
-            new_voltages = data['voltage']
-
-            if len(self.time_buffers[key]) > 0:
-                mask = new_times > self.time_buffers[key][-1]
-                new_times, new_voltages = new_times[mask], new_voltages[mask]
-
-            for t, v in zip(new_times, new_voltages):
-                self.time_buffers[key].append(t)
-                self.voltage_buffers[key].append(v)
-
-            current_time = data['time'][-1]
-            window_start = max(0, current_time - self.window_ms)
-            times_array = np.array(self.time_buffers[key])
-            volts_array = np.array(self.voltage_buffers[key])
-            display_times = times_array - window_start
-            mask = display_times >= 0
-
-            self.voltage_lines[key].set_data(display_times[mask], volts_array[mask])
+            self._ingest(self.trace_buffers[key], data)
             firing_rates[key] = data['firing_rate']
-
-        self.compare_canvas.refresh()
+        self._needs_repaint = True
 
         if firing_rates:
             self.info_label.setText(
@@ -619,25 +709,49 @@ class NeuronExplorerWidget(QWidget):
         if len(data['time']) == 0:
             return
 
-        new_times = data['time']
-        new_voltages = data['voltage']
-
-        if len(self.challenge_time_buffer) > 0:
-            mask = new_times > self.challenge_time_buffer[-1]
-            new_times, new_voltages = new_times[mask], new_voltages[mask]
-
-        for t, v in zip(new_times, new_voltages):
-            self.challenge_time_buffer.append(t)
-            self.challenge_voltage_buffer.append(v)
+        self._ingest(self.challenge_trace, data)
+        self._needs_repaint = True
+        self.info_label.setText(f"Firing rate: {data['firing_rate']:.1f} Hz | Keep adjusting to achieve the target pattern!")
 
-        current_time = data['time'][-1]
-        window_start = max(0, current_time - self.window_ms)
-        times_array = np.array(self.challenge_time_buffer)
-        volts_array = np.array(self.challenge_voltage_buffer)
-        display_times = times_array - window_start
-        mask = display_times >= 0
+    def _window_slices(self, buf, ax):
+        window_start = max(0.0, buf.last_time() - self.window_ms)
+        # times are monotonic: one binary search instead of a full-array
+        # mask plus boolean indexing
+        start_idx = np.searchsorted(buf.times, window_start)
+        disp_t = buf.times[start_idx:] - window_start
+        disp_v = buf.values[start_idx:]
+
+        # at most two points per horizontal pixel; min/max keeps spikes
+        n_bins = max(min(int(ax.bbox.width), 400), 100)
+        return decimate_minmax(disp_t, disp_v, n_bins)
+
+    def _repaint(self):
+        """Paint cadence: read the buffers and redraw; no simulation here."""
+        if not self._needs_repaint:
+            return
+        self._needs_repaint = False
 
-        self.challenge_voltage_line.set_data(display_times[mask], volts_array[mask])
+        if self.challenge_mode:
+            buf = self.challenge_trace
+            if len(buf) == 0:
+                return
+            disp_t, disp_v = self._window_slices(buf, self.challenge_ax_voltage)
+            self.challenge_voltage_line.set_data(disp_t, disp_v)
+            self.challenge_canvas.refresh()
+            return
 
-        self.challenge_canvas.refresh()
-        self.info_label.setText(f"Firing rate: {data['firing_rate']:.1f} Hz | Keep adjusting to achieve the target pattern!")
+        for key, buf in self.trace_buffers.items():
+            if len(buf) == 0:
+                continue
+            disp_t, disp_v = self._window_slices(buf, self.compare_axes[key])
+            self.voltage_lines[key].set_data(disp_t, disp_v)
+
+        # blit: restore the cached background and redraw only the traces,
+        # skipping tick/title/spine rasterization
+        canvas = self.compare_canvas
+        if self._compare_bg is None:
+            canvas.draw()
+        for key, ax in self.compare_axes.items():
+            canvas.restore_region(self._compare_bg[key])
+            ax.draw_artist(self.voltage_lines[key])
+            canvas.blit(ax.bbox)
@@ -1,11 +1,15 @@
+import time
+
 import numpy as np
-from collections import deque
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, QLabel
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QSlider, QLabel, QProgressBar)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
 from src.neurons.single_neuron import SingleNeuronSimulation
 from src.gui.canvas import MplCanvas
+from src.gui.trace_buffer import TraceBuffer
+from src.gui._fast import decimate_minmax
 
 
 class SingleNeuronWidget(QWidget):
@@ -18,8 +22,7 @@ class SingleNeuronWidget(QWidget):
         self.is_running = False
         self.success_count = 0
         self.window_ms = 500
-        self.voltage_buffer = deque(maxlen=5000)
-        self.time_buffer = deque(maxlen=5000)
+        self.trace_buffer = TraceBuffer(5000)
         self.init_ui()
 
     def init_ui(self):
@@ -50,6 +53,7 @@ class SingleNeuronWidget(QWidget):
         self.canvas = MplCanvas(self, width=10, height=5)
         layout.addWidget(self.canvas)
         self.setup_plots()
+        self.canvas.mpl_connect('draw_event', self._on_draw)
 
         control_layout = QHBoxLayout()
 
@@ -61,6 +65,16 @@ class SingleNeuronWidget(QWidget):
         self.current_slider.setRange(0, 5000)
         self.current_slider.valueChanged.connect(self.on_current_changed)
         slider_layout.addWidget(self.current_slider)
+
+        self.rate_label = QLabel("Firing Rate (target: 10 Hz)")
+        self.rate_label.setStyleSheet("color: #2d3436;")
+        slider_layout.addWidget(self.rate_label)
+        self.rate_bar = QProgressBar()
+        self.rate_bar.setRange(0, 30)
+        self.rate_bar.setFormat("%v Hz")
+        self._rate_on_target = None
+        self._set_rate_bar_color(False)
+        slider_layout.addWidget(self.rate_bar)
         control_layout.addLayout(slider_layout)
 
         btn_layout = QVBoxLayout()
@@ -88,37 +102,48 @@ class SingleNeuronWidget(QWidget):
         layout.addWidget(self.continue_btn)
 
         self.timer = QTimer()
+        # coarse timers let timeouts pile up when a tick overruns; precise
+        # ticks plus the frame drop in update_simulation keep latency bounded
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_simulation)
+        self._last_tick = 0.0
+
+    def _set_rate_bar_color(self, on_target):
+        if on_target == self._rate_on_target:
+            return
+        self._rate_on_target = on_target
+        color = '#2ecc71' if on_target else '#e74c3c'
+        self.rate_bar.setStyleSheet(
+            "QProgressBar { border: 1px solid #b2bec3; border-radius: 5px;"
+            " background-color: #ffffff; color: #2d3436; text-align: center; }"
+            f" QProgressBar::chunk {{ background-color: {color}; }}"
+        )
 
     def setup_plots(self):
         self.canvas.fig.clear()
         self.canvas.fig.set_facecolor('#f5f6fa')
-        gs = self.canvas.fig.add_gridspec(1, 2, width_ratios=[3, 1], wspace=0.3)
 
-        self.ax_voltage = self.canvas.fig.add_subplot(gs[0, 0])
+        self.ax_voltage = self.canvas.fig.add_subplot(111)
         self.ax_voltage.set_facecolor('#ffffff')
         self.ax_voltage.set_ylabel('Voltage', color='#2d3436')
         self.ax_voltage.set_xlabel('Time (ms)', color='#2d3436')
         self.ax_voltage.tick_params(colors='#2d3436')
         self.ax_voltage.set_ylim(-80, 40)
         self.ax_voltage.set_xlim(0, self.window_ms)
-        self.voltage_line, = self.ax_voltage.plot([], [], color='#3498db', linewidth=1)
+        self.voltage_line, = self.ax_voltage.plot([], [], color='#3498db', linewidth=1,
+                                                  animated=True, antialiased=False)
         for spine in self.ax_voltage.spines.values():
             spine.set_color('#b2bec3')
 
-        self.ax_rate = self.canvas.fig.add_subplot(gs[0, 1])
-        self.ax_rate.set_facecolor('#ffffff')
-        self.ax_rate.set_xlim(0, 1)
-        self.ax_rate.set_ylim(0, 30)
-        self.ax_rate.axhline(y=10, color='#2ecc71', linestyle='--', linewidth=2)
-        self.ax_rate.set_title('Firing Rate', color='#2d3436')
-        self.ax_rate.tick_params(colors='#2d3436')
-        for spine in self.ax_rate.spines.values():
-            spine.set_color('#b2bec3')
+        # Background for blitting; recaptured on every full draw (resize etc.)
+        self._bg_voltage = None
 
         self.canvas.fig.tight_layout()
         self.canvas.draw()
 
+    def _on_draw(self, event):
+        self._bg_voltage = self.canvas.copy_from_bbox(self.ax_voltage.bbox)
+
     def on_current_changed(self, value):
         self.current_label.setText(f"Input Current: {value/10:.1f}")
         self.simulation.set_input_current(value / 10.0)
@@ -139,50 +164,56 @@ class SingleNeuronWidget(QWidget):
         self.timer.stop()
         self.is_running = False
         self.start_btn.setText("Start")
-        self.voltage_buffer.clear()
-        self.time_buffer.clear()
+        self.trace_buffer.clear()
         self.simulation.reset()
         self.setup_plots()
+        self.rate_bar.setValue(0)
+        self._set_rate_bar_color(False)
         self.success_count = 0
         self.continue_btn.hide()
 
     def update_simulation(self):
         if not self.is_running:
             return
+        now = time.perf_counter()
+        if now - self._last_tick < 0.8 * self.timer.interval() / 1000.0:
+            return  # queued timeout from a slow frame; drop it
+        self._last_tick = now
         data = self.simulation.run_step(duration_ms=50)
         if len(data['time']) == 0:
             return
 
-        new_times = data['time']
-        new_voltages = data['voltage']
-        if len(self.time_buffer) > 0:
-            mask = new_times > self.time_buffer[-1]
-            new_times, new_voltages = new_times[mask], new_voltages[mask]
-        for t, v in zip(new_times, new_voltages):
-            self.time_buffer.append(t)
-            self.voltage_buffer.append(v)
+        # display precision only: halve the bytes on the plot path up front
+        new_times = data['time'].astype(np.float32, copy=False)
+        new_voltages = data['voltage'].astype(np.float32, copy=False)
+        # new_times is monotonic, so slice off already-buffered samples with
+        # a binary search; the slices are views, not copies
+        seen = np.searchsorted(new_times, self.trace_buffer.last_time(), side='right')
+        self.trace_buffer.append(new_times[seen:], new_voltages[seen:])
 
         current_time = data['time'][-1]
         window_start = max(0, current_time - self.window_ms)
-        times_array = np.array(self.time_buffer)
-        volts_array = np.array(self.voltage_buffer)
-        display_times = times_array - window_start
-        mask = display_times >= 0
-        self.voltage_line.set_data(display_times[mask], volts_array[mask])
-
-        self.ax_rate.clear()
-        self.ax_rate.set_facecolor('#ffffff')
-        self.ax_rate.set_xlim(0, 1)
-        self.ax_rate.set_ylim(0, 30)
-        self.ax_rate.axhline(y=10, color='#2ecc71', linestyle='--', linewidth=2)
-        bar_color = '#2ecc71' if data['on_target'] else '#e74c3c'
-        self.ax_rate.bar(0.5, data['firing_rate'], width=0.4, color=bar_color)
-        self.ax_rate.set_title(f"{data['firing_rate']:.1f} Hz", color='#2d3436')
-        self.ax_rate.tick_params(colors='#2d3436')
-        for spine in self.ax_rate.spines.values():
-            spine.set_color('#b2bec3')
-
-        self.canvas.refresh()
+        times_array = self.trace_buffer.times
+        volts_array = self.trace_buffer.values
+        # buffer times are monotonic: find the window start by binary search
+        # and slice views instead of scanning a boolean mask
+        start = np.searchsorted(times_array, window_start)
+        disp_t = times_array[start:] - window_start
+        disp_v = volts_array[start:]
+        # at most two samples per pixel column; min/max bins keep the spikes
+        n_bins = max(min(int(self.ax_voltage.bbox.width), 400), 100)
+        disp_t, disp_v = decimate_minmax(disp_t, disp_v, n_bins)
+        self.voltage_line.set_data(disp_t, disp_v)
+
+        self.rate_bar.setValue(int(round(data['firing_rate'])))
+        self._set_rate_bar_color(data['on_target'])
+
+        canvas = self.canvas
+        if self._bg_voltage is None:
+            canvas.draw()
+        canvas.restore_region(self._bg_voltage)
+        self.ax_voltage.draw_artist(self.voltage_line)
+        canvas.blit(self.ax_voltage.bbox)
         self.hint_label.setText(self.simulation.get_hint(data['firing_rate']))
 
         if data['on_target']:
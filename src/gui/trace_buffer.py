@@ -0,0 +1,61 @@
+import numpy as np
+
+
+class TraceBuffer:
+    """Fixed-capacity time/value history for streaming plots.
+
+    Samples live in preallocated float32 arrays with 2x headroom; when the
+    headroom fills up the newest `capacity` samples are compacted to the
+    front. Appends are bulk copies and `times`/`values` are always
+    contiguous views, so there is no per-frame deque-to-ndarray
+    materialization on the plot path.
+    """
+
+    def __init__(self, capacity=5000):
+        self.capacity = capacity
+        self._t = np.empty(2 * capacity, dtype=np.float32)
+        self._v = np.empty(2 * capacity, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+        self._last_t = -np.inf
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def times(self):
+        return self._t[self._start:self._end]
+
+    @property
+    def values(self):
+        return self._v[self._start:self._end]
+
+    def last_time(self):
+        """Timestamp of the newest sample, kept at full precision."""
+        return self._last_t
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self._last_t = -np.inf
+
+    def append(self, times, values):
+        n = len(times)
+        if n == 0:
+            return
+        self._last_t = float(times[-1])
+        if n >= self.capacity:
+            times = times[-self.capacity:]
+            values = values[-self.capacity:]
+            n = self.capacity
+        if self._end + n > self._t.shape[0]:
+            keep = self.capacity - n
+            self._t[:keep] = self._t[self._end - keep:self._end]
+            self._v[:keep] = self._v[self._end - keep:self._end]
+            self._start = 0
+            self._end = keep
+        self._t[self._end:self._end + n] = times
+        self._v[self._end:self._end + n] = values
+        self._end += n
+        if self._end - self._start > self.capacity:
+            self._start = self._end - self.capacity
@@ -1,12 +1,30 @@
 from brian2 import (
-    NeuronGroup, Synapses, SpikeMonitor, PopulationRateMonitor,
+    NeuronGroup, Synapses, SpikeMonitor,
     Network, defaultclock, start_scope, prefs,
-    ms, mV, Hz, second, pA, nS, pF, Mohm
+    ms, mV, pA, nS, pF, Mohm
 )
+import hashlib
+import os
+
 import numpy as np
 from abc import ABC, abstractmethod
 
-prefs.codegen.target = 'numpy'
+try:
+    import Cython  # noqa: F401
+    _CODEGEN_TARGET = 'cython'
+except ImportError:
+    _CODEGEN_TARGET = 'numpy'
+
+prefs.codegen.target = _CODEGEN_TARGET
+if _CODEGEN_TARGET == 'cython':
+    # kernels are compiled once and cached on disk, so pay for aggressive
+    # optimization up front
+    prefs.codegen.cpp.extra_compile_args = ['-O3', '-march=native']
+
+# update_params writes through the _-suffixed raw attributes, which take
+# plain SI floats and skip the Quantity dimension checks; the build path
+# keeps the unit-ful writes so dimensions are still validated once
+_PA = 1e-12
 
 LIF_EQS = '''
 dv/dt = (-(v - v_rest) + R_m * (I_ext + I_syn)) / tau_m : volt
@@ -14,11 +32,11 @@ I_syn = I_exc - I_inh : amp
 dI_exc/dt = -I_exc / tau_exc : amp
 dI_inh/dt = -I_inh / tau_inh : amp
 I_ext : amp
-R_m : ohm
-tau_m : second
-v_rest : volt
-tau_exc : second
-tau_inh : second
+R_m : ohm (constant, shared)
+tau_m : second (constant, shared)
+v_rest : volt (constant, shared)
+tau_exc : second (constant, shared)
+tau_inh : second (constant, shared)
 '''
 
 ADEX_EQS = '''
@@ -28,18 +46,78 @@ I_syn = I_exc - I_inh : amp
 dI_exc/dt = -I_exc / tau_exc : amp
 dI_inh/dt = -I_inh / tau_inh : amp
 I_ext : amp
-R_m : ohm
-tau_m : second
-E_L : volt
-V_T : volt
-Delta_T : volt
-a : siemens
-tau_w : second
-tau_exc : second
-tau_inh : second
+R_m : ohm (constant, shared)
+tau_m : second (constant, shared)
+E_L : volt (constant, shared)
+V_T : volt (constant, shared)
+Delta_T : volt (constant, shared)
+a : siemens (constant, shared)
+tau_w : second (constant, shared)
+tau_exc : second (constant, shared)
+tau_inh : second (constant, shared)
 '''
 
-def create_E_cells(n_exc, input_drive_E):
+_RNG = np.random.default_rng()
+
+_EDGE_CACHE = {}
+
+_EDGE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'workshop_game')
+
+
+def _bernoulli_edges(n_pre, n_post, p, exclude_diag=False, seed=None):
+    """Sample Bernoulli connectivity as (i, j) index arrays.
+
+    One vectorized draw replaces Brian2's pairwise condition evaluation.
+    With a seed the result is deterministic and cached, in memory and as
+    an .npz under ~/.cache/workshop_game, so rebuilding a known topology
+    reuses the wiring for free even across sessions.
+    """
+    key = (n_pre, n_post, p, exclude_diag, seed)
+    cached = _EDGE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    path = None
+    if seed is not None:
+        digest = hashlib.blake2b(repr(key).encode()).hexdigest()[:16]
+        path = os.path.join(_EDGE_CACHE_DIR, f'edges_{digest}.npz')
+        if os.path.exists(path):
+            with np.load(path) as f:
+                edges = (f['i'], f['j'])
+            _EDGE_CACHE[key] = edges
+            return edges
+
+    if seed is None:
+        rng = _RNG
+    else:
+        rng = np.random.default_rng(hash(key) & 0xFFFFFFFFFFFFFFFF)
+    mask = rng.random((n_pre, n_post)) < p
+    if exclude_diag:
+        np.fill_diagonal(mask, False)
+    i, j = np.nonzero(mask)
+    edges = (i.astype(np.int32), j.astype(np.int32))
+    if seed is not None:
+        _EDGE_CACHE[key] = edges
+        try:
+            os.makedirs(_EDGE_CACHE_DIR, exist_ok=True)
+            np.savez(path, i=edges[0], j=edges[1])
+        except OSError:
+            pass  # read-only home: in-memory cache still applies
+    return edges
+
+
+def _split_noise(counts):
+    """One batched Gaussian draw, returned as per-population views."""
+    noise = _RNG.standard_normal(sum(counts))
+    views = []
+    start = 0
+    for n in counts:
+        views.append(noise[start:start + n])
+        start += n
+    return views
+
+
+def create_E_cells(n_exc, input_drive_E, v_noise=None, I_noise=None):
     E = NeuronGroup(
         n_exc, ADEX_EQS,
         threshold='v > -40*mV',
@@ -57,15 +135,17 @@ def create_E_cells(n_exc, input_drive_E):
     E.tau_exc = 3*ms      
     E.tau_inh = 6*ms      
 
-    E.v = E.E_L + np.random.randn(n_exc) * 3*mV
+    if v_noise is None:
+        v_noise, I_noise = _split_noise((n_exc, n_exc))
+    E.v = E.E_L + v_noise * 3*mV
     E.w = 0*pA
-    E.I_ext = (input_drive_E + np.random.randn(n_exc) * 20) * pA
+    E.I_ext = (input_drive_E + I_noise * 20) * pA
     E.I_exc = 0*pA
     E.I_inh = 0*pA
     return E
 
 
-def create_PV_cells(n_pv, input_drive_PV):
+def create_PV_cells(n_pv, input_drive_PV, v_noise=None, I_noise=None):
     PV = NeuronGroup(
         n_pv, ADEX_EQS,
         threshold='v > -45*mV',     
@@ -83,15 +163,17 @@ def create_PV_cells(n_pv, input_drive_PV):
     PV.tau_exc = 1*ms   
     PV.tau_inh = 2*ms   
 
-    PV.v = PV.E_L + np.random.randn(n_pv) * 3*mV
+    if v_noise is None:
+        v_noise, I_noise = _split_noise((n_pv, n_pv))
+    PV.v = PV.E_L + v_noise * 3*mV
     PV.w = 0*pA
-    PV.I_ext = (input_drive_PV + np.random.randn(n_pv) * 15) * pA
+    PV.I_ext = (input_drive_PV + I_noise * 15) * pA
     PV.I_exc = 0*pA
     PV.I_inh = 0*pA
     return PV
 
 
-def create_SOM_cells(n_som, input_drive_SOM):
+def create_SOM_cells(n_som, input_drive_SOM, v_noise=None, I_noise=None):
     SOM = NeuronGroup(
         n_som, ADEX_EQS,
         threshold='v > -40*mV',
@@ -109,33 +191,87 @@ def create_SOM_cells(n_som, input_drive_SOM):
     SOM.tau_exc = 8*ms
     SOM.tau_inh = 30*ms    
 
-    SOM.v = SOM.E_L + np.random.randn(n_som) * 3*mV
+    if v_noise is None:
+        v_noise, I_noise = _split_noise((n_som, n_som))
+    SOM.v = SOM.E_L + v_noise * 3*mV
     SOM.w = 0*pA
-    SOM.I_ext = (input_drive_SOM + np.random.randn(n_som) * 10) * pA
+    SOM.I_ext = (input_drive_SOM + I_noise * 10) * pA
     SOM.I_exc = 0*pA
     SOM.I_inh = 0*pA
     return SOM
 
 class BaseNetwork(ABC):
+    # Brian2 code generator: 'cython' compiles the state updates and
+    # synaptic propagation to C loops; 'numpy' is the pure-Python fallback.
+    codegen_target = _CODEGEN_TARGET
+
+    # Attribute names that define the network's wiring; changing any of
+    # them forces a rebuild, anything else is pushed into the live network.
+    _topology_params = ()
+
     def __init__(self):
+        prefs.codegen.target = self.codegen_target
         self.neurons = {}
         self.synapses = {}
         self.spike_monitors = {}
-        self.rate_monitors = {}
         self.network = None
         self.is_setup = False
+        # 0.1 ms resolves the fastest membrane time constant (PV: tau_m
+        # = 5 ms) with 50 steps; exponential_euler keeps the linear part
+        # stable at this resolution
+        self.dt_ms = 0.1
+        self._topology_hash = None
+        self._t0_ms = 0.0
+        self._spike_start = {}
+        self._rate_names = []
 
-    @abstractmethod
     def setup(self, **kwargs):
-        pass
+        for param, value in kwargs.items():
+            if hasattr(self, param) and value is not None:
+                setattr(self, param, value)
+
+        assert self.dt_ms <= 1.0, f"dt = {self.dt_ms} ms is too coarse for tau_m = 5 ms"
+        topology = hash((self.dt_ms,)
+                        + tuple(getattr(self, name) for name in self._topology_params))
+        if self.network is None or topology != self._topology_hash:
+            self.neurons.clear()
+            self.synapses.clear()
+            self.spike_monitors.clear()
+            start_scope()
+            defaultclock.dt = self.dt_ms * ms
+            # _bernoulli_edges seeds itself from this hash, so the same
+            # topology params always produce the same wiring
+            self._topology_hash = topology
+            self._build_once()
+            self._build_network()
+        self.update_params()
+
+        # runs start mid-stream on a cached network: remember where this
+        # one begins so _collect_data can report times relative to it
+        self._t0_ms = float(self.network.t / ms)
+        self._spike_start = {name: len(m.t) for name, m in self.spike_monitors.items()}
+        self.is_setup = True
+
+    @abstractmethod
+    def _build_once(self):
+        """Create neuron groups, synapses and monitors for the current topology."""
+
+    @abstractmethod
+    def update_params(self):
+        """Push scalar weights and input drives into the live network."""
+
+    def _connect(self, name, n_pre, n_post, p, exclude_diag=False):
+        i, j = _bernoulli_edges(n_pre, n_post, p, exclude_diag,
+                                seed=(self._topology_hash, name))
+        self.synapses[name].connect(i=i, j=j)
 
     def _build_network(self):
         objects = []
         objects.extend(self.neurons.values())
         objects.extend(self.synapses.values())
         objects.extend(self.spike_monitors.values())
-        objects.extend(self.rate_monitors.values())
         self.network = Network(objects)
+        self._rate_names = list(self.spike_monitors)
 
     def run_step(self, duration_ms=100):
         if self.network is None:
@@ -150,17 +286,32 @@ class BaseNetwork(ABC):
             'rates': {},
         }
 
+        # the _-suffixed attributes are the monitors' raw unitless arrays
+        # (seconds / Hz); slicing them avoids the Quantity round trip and
+        # full-history copy of e.g. np.array(monitor.t / ms)
         for name, monitor in self.spike_monitors.items():
+            start = self._spike_start.get(name, 0)
             data['spikes'][name] = {
-                'times': np.array(monitor.t / ms),
-                'indices': np.array(monitor.i)
+                'times': monitor.t_[start:] * 1000.0 - self._t0_ms,
+                'indices': np.asarray(monitor.i_[start:])
             }
 
-        for name, monitor in self.rate_monitors.items():
-            data['rates'][name] = {
-                'times': np.array(monitor.t / ms),
-                'rates': np.array(monitor.rate / Hz)
-            }
+        # population rates are binned from the spike monitors on demand
+        # instead of paying a per-timestep PopulationRateMonitor write;
+        # 1 ms bins are far finer than the ~100 ms smoothing the GUI uses
+        bin_ms = 1.0
+        elapsed_ms = float(self.network.t / ms) - self._t0_ms
+        n_bins = max(int(round(elapsed_ms / bin_ms)), 1)
+        values = np.empty((len(self.spike_monitors), n_bins), dtype=np.float32)
+        for row, name in enumerate(self._rate_names):
+            counts, _ = np.histogram(data['spikes'][name]['times'],
+                                     bins=n_bins, range=(0.0, n_bins * bin_ms))
+            values[row] = counts * (1000.0 / (bin_ms * len(self.neurons[name])))
+        data['rates'] = {
+            'times': (np.arange(n_bins, dtype=np.float32) + 0.5) * bin_ms,
+            'names': self._rate_names,
+            'values': values,
+        }
 
         return data
 
@@ -181,54 +332,53 @@ class E_PV_Network(BaseNetwork):
         self.J_PVPV = 20.0
  
 
-        self.p_EE = 0.1   
-        self.p_EPV = 0.3   
-        self.p_PVE = 0.4   
-        self.p_PVPV = 0.35  
-
-
-    def setup(self, **kwargs):
-
-        for param, value in kwargs.items():
-            if hasattr(self, param) and value is not None:
-                setattr(self, param, value)
+        self.p_EE = 0.1
+        self.p_EPV = 0.3
+        self.p_PVE = 0.4
+        self.p_PVPV = 0.35
 
-        start_scope()
-        defaultclock.dt = 0.05 * ms 
+    _topology_params = ('n_exc', 'n_pv', 'p_EE', 'p_EPV', 'p_PVE', 'p_PVPV')
 
-        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E)
-        self.neurons['PV'] = create_PV_cells(self.n_pv, self.input_drive_PV)
+    def _build_once(self):
+        v_E, i_E, v_PV, i_PV = _split_noise((self.n_exc, self.n_exc,
+                                             self.n_pv, self.n_pv))
+        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E, v_E, i_E)
+        self.neurons['PV'] = create_PV_cells(self.n_pv, self.input_drive_PV, v_PV, i_PV)
         E = self.neurons['E']
         PV = self.neurons['PV']
 
-        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_E'].connect(p=self.p_EE, condition='i != j')
+        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_E', self.n_exc, self.n_exc, self.p_EE, exclude_diag=True)
         self.synapses['E_E'].w_syn = self.J_EE * pA
 
-        self.synapses['E_PV'] = Synapses(E, PV, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_PV'].connect(p=self.p_EPV)
+        self.synapses['E_PV'] = Synapses(E, PV, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_PV', self.n_exc, self.n_pv, self.p_EPV)
         self.synapses['E_PV'].w_syn = self.J_EPV * pA
 
 
 
-        self.synapses['PV_E'] = Synapses(PV, E, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['PV_E'].connect(p=self.p_PVE)
+        self.synapses['PV_E'] = Synapses(PV, E, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('PV_E', self.n_pv, self.n_exc, self.p_PVE)
         self.synapses['PV_E'].w_syn = self.J_PVE * pA
 
 
      
 
-        self.synapses['PV_PV'] = Synapses(PV, PV, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['PV_PV'].connect(p=self.p_PVPV, condition='i != j')
+        self.synapses['PV_PV'] = Synapses(PV, PV, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('PV_PV', self.n_pv, self.n_pv, self.p_PVPV, exclude_diag=True)
         self.synapses['PV_PV'].w_syn = self.J_PVPV * pA
 
         self.spike_monitors['E'] = SpikeMonitor(E)
         self.spike_monitors['PV'] = SpikeMonitor(PV)
-        self.rate_monitors['E'] = PopulationRateMonitor(E)
-        self.rate_monitors['PV'] = PopulationRateMonitor(PV)
 
-        self._build_network()
-        self.is_setup = True
+    def update_params(self):
+        self.synapses['E_E'].w_syn_ = self.J_EE * _PA
+        self.synapses['E_PV'].w_syn_ = self.J_EPV * _PA
+        self.synapses['PV_E'].w_syn_ = self.J_PVE * _PA
+        self.synapses['PV_PV'].w_syn_ = self.J_PVPV * _PA
+        i_E, i_PV = _split_noise((self.n_exc, self.n_pv))
+        self.neurons['E'].I_ext_ = (self.input_drive_E + i_E * 20) * _PA
+        self.neurons['PV'].I_ext_ = (self.input_drive_PV + i_PV * 15) * _PA
 
 
 
@@ -247,51 +397,43 @@ class E_SOM_Network(BaseNetwork):
         self.J_ESOM = 30.0 
         self.J_SOME = 45.0 
 
-        self.p_EE = 0.1 
-        self.p_ESOM = 0.35 
-        self.p_SOME = 0.35  
-
-    def setup(self, input_drive_E=None, input_drive_SOM=None,
-              J_EE=None, J_ESOM=None, J_SOME=None,
-              p_EE=None, p_ESOM=None, p_SOME=None, **kwargs):
-
-        if input_drive_E is not None: self.input_drive_E = input_drive_E
-        if input_drive_SOM is not None: self.input_drive_SOM = input_drive_SOM
-        if J_EE is not None: self.J_EE = J_EE
-        if J_ESOM is not None: self.J_ESOM = J_ESOM
-        if J_SOME is not None: self.J_SOME = J_SOME
-        if p_EE is not None: self.p_EE = p_EE
-        if p_ESOM is not None: self.p_ESOM = p_ESOM
-        if p_SOME is not None: self.p_SOME = p_SOME
-
-        start_scope()
-        defaultclock.dt = 0.05 * ms  
-
-        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E)
-        self.neurons['SOM'] = create_SOM_cells(self.n_som, self.input_drive_SOM)
+        self.p_EE = 0.1
+        self.p_ESOM = 0.35
+        self.p_SOME = 0.35
+
+    _topology_params = ('n_exc', 'n_som', 'p_EE', 'p_ESOM', 'p_SOME')
+
+    def _build_once(self):
+        v_E, i_E, v_SOM, i_SOM = _split_noise((self.n_exc, self.n_exc,
+                                               self.n_som, self.n_som))
+        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E, v_E, i_E)
+        self.neurons['SOM'] = create_SOM_cells(self.n_som, self.input_drive_SOM, v_SOM, i_SOM)
         E = self.neurons['E']
         SOM = self.neurons['SOM']
 
 
-        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_E'].connect(p=self.p_EE, condition='i != j')
+        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_E', self.n_exc, self.n_exc, self.p_EE, exclude_diag=True)
         self.synapses['E_E'].w_syn = self.J_EE * pA
 
-        self.synapses['E_SOM'] = Synapses(E, SOM, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_SOM'].connect(p=self.p_ESOM)
+        self.synapses['E_SOM'] = Synapses(E, SOM, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_SOM', self.n_exc, self.n_som, self.p_ESOM)
         self.synapses['E_SOM'].w_syn = self.J_ESOM * pA
 
-        self.synapses['SOM_E'] = Synapses(SOM, E, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['SOM_E'].connect(p=self.p_SOME)
+        self.synapses['SOM_E'] = Synapses(SOM, E, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('SOM_E', self.n_som, self.n_exc, self.p_SOME)
         self.synapses['SOM_E'].w_syn = self.J_SOME * pA
 
         self.spike_monitors['E'] = SpikeMonitor(E)
         self.spike_monitors['SOM'] = SpikeMonitor(SOM)
-        self.rate_monitors['E'] = PopulationRateMonitor(E)
-        self.rate_monitors['SOM'] = PopulationRateMonitor(SOM)
 
-        self._build_network()
-        self.is_setup = True
+    def update_params(self):
+        self.synapses['E_E'].w_syn_ = self.J_EE * _PA
+        self.synapses['E_SOM'].w_syn_ = self.J_ESOM * _PA
+        self.synapses['SOM_E'].w_syn_ = self.J_SOME * _PA
+        i_E, i_SOM = _split_noise((self.n_exc, self.n_som))
+        self.neurons['E'].I_ext_ = (self.input_drive_E + i_E * 20) * _PA
+        self.neurons['SOM'].I_ext_ = (self.input_drive_SOM + i_SOM * 10) * _PA
 
 
 
@@ -320,62 +462,68 @@ class E_PV_SOM_Network(BaseNetwork):
         self.p_ESOM = 0.35 
         self.p_PVE = 0.4  
         self.p_PVPV = 0.35
-        self.p_SOME = 0.3 
-        self.p_SOMPV = 0.35 
-
-    def setup(self, **kwargs):
-        for param, value in kwargs.items():
-            if hasattr(self, param) and value is not None:
-                setattr(self, param, value)
-
-        start_scope()
-        defaultclock.dt = 0.05 * ms  
-     
-        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E)
-        self.neurons['PV'] = create_PV_cells(self.n_pv, self.input_drive_PV)
-        self.neurons['SOM'] = create_SOM_cells(self.n_som, self.input_drive_SOM)
+        self.p_SOME = 0.3
+        self.p_SOMPV = 0.35
+
+    _topology_params = ('n_exc', 'n_pv', 'n_som', 'p_EE', 'p_EPV', 'p_ESOM',
+                        'p_PVE', 'p_PVPV', 'p_SOME', 'p_SOMPV')
+
+    def _build_once(self):
+        v_E, i_E, v_PV, i_PV, v_SOM, i_SOM = _split_noise(
+            (self.n_exc, self.n_exc, self.n_pv, self.n_pv,
+             self.n_som, self.n_som))
+        self.neurons['E'] = create_E_cells(self.n_exc, self.input_drive_E, v_E, i_E)
+        self.neurons['PV'] = create_PV_cells(self.n_pv, self.input_drive_PV, v_PV, i_PV)
+        self.neurons['SOM'] = create_SOM_cells(self.n_som, self.input_drive_SOM, v_SOM, i_SOM)
         E = self.neurons['E']
         PV = self.neurons['PV']
         SOM = self.neurons['SOM']
 
-        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_E'].connect(p=self.p_EE, condition='i != j')
+        self.synapses['E_E'] = Synapses(E, E, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_E', self.n_exc, self.n_exc, self.p_EE, exclude_diag=True)
         self.synapses['E_E'].w_syn = self.J_EE * pA
 
-        self.synapses['E_PV'] = Synapses(E, PV, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_PV'].connect(p=self.p_EPV)
+        self.synapses['E_PV'] = Synapses(E, PV, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_PV', self.n_exc, self.n_pv, self.p_EPV)
         self.synapses['E_PV'].w_syn = self.J_EPV * pA
 
-        self.synapses['E_SOM'] = Synapses(E, SOM, 'w_syn : amp', on_pre='I_exc_post += w_syn')
-        self.synapses['E_SOM'].connect(p=self.p_ESOM)
+        self.synapses['E_SOM'] = Synapses(E, SOM, 'w_syn : amp (shared)', on_pre='I_exc_post += w_syn')
+        self._connect('E_SOM', self.n_exc, self.n_som, self.p_ESOM)
         self.synapses['E_SOM'].w_syn = self.J_ESOM * pA
 
-        self.synapses['PV_E'] = Synapses(PV, E, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['PV_E'].connect(p=self.p_PVE)
+        self.synapses['PV_E'] = Synapses(PV, E, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('PV_E', self.n_pv, self.n_exc, self.p_PVE)
         self.synapses['PV_E'].w_syn = self.J_PVE * pA
 
-        self.synapses['SOM_E'] = Synapses(SOM, E, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['SOM_E'].connect(p=self.p_SOME)
+        self.synapses['SOM_E'] = Synapses(SOM, E, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('SOM_E', self.n_som, self.n_exc, self.p_SOME)
         self.synapses['SOM_E'].w_syn = self.J_SOME * pA
 
-        self.synapses['SOM_PV'] = Synapses(SOM, PV, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['SOM_PV'].connect(p=self.p_SOMPV)
+        self.synapses['SOM_PV'] = Synapses(SOM, PV, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('SOM_PV', self.n_som, self.n_pv, self.p_SOMPV)
         self.synapses['SOM_PV'].w_syn = self.J_SOMPV * pA
 
-        self.synapses['PV_PV'] = Synapses(PV, PV, 'w_syn : amp', on_pre='I_inh_post += w_syn')
-        self.synapses['PV_PV'].connect(p=self.p_PVPV, condition='i != j')
+        self.synapses['PV_PV'] = Synapses(PV, PV, 'w_syn : amp (shared)', on_pre='I_inh_post += w_syn')
+        self._connect('PV_PV', self.n_pv, self.n_pv, self.p_PVPV, exclude_diag=True)
         self.synapses['PV_PV'].w_syn = self.J_PVPV * pA
 
 
         self.spike_monitors['E'] = SpikeMonitor(E)
         self.spike_monitors['PV'] = SpikeMonitor(PV)
         self.spike_monitors['SOM'] = SpikeMonitor(SOM)
-        self.rate_monitors['E'] = PopulationRateMonitor(E)
-        self.rate_monitors['PV'] = PopulationRateMonitor(PV)
-        self.rate_monitors['SOM'] = PopulationRateMonitor(SOM)
 
-        self._build_network()
-        self.is_setup = True
+    def update_params(self):
+        self.synapses['E_E'].w_syn_ = self.J_EE * _PA
+        self.synapses['E_PV'].w_syn_ = self.J_EPV * _PA
+        self.synapses['E_SOM'].w_syn_ = self.J_ESOM * _PA
+        self.synapses['PV_E'].w_syn_ = self.J_PVE * _PA
+        self.synapses['SOM_E'].w_syn_ = self.J_SOME * _PA
+        self.synapses['SOM_PV'].w_syn_ = self.J_SOMPV * _PA
+        self.synapses['PV_PV'].w_syn_ = self.J_PVPV * _PA
+        i_E, i_PV, i_SOM = _split_noise((self.n_exc, self.n_pv, self.n_som))
+        self.neurons['E'].I_ext_ = (self.input_drive_E + i_E * 20) * _PA
+        self.neurons['PV'].I_ext_ = (self.input_drive_PV + i_PV * 15) * _PA
+        self.neurons['SOM'].I_ext_ = (self.input_drive_SOM + i_SOM * 10) * _PA
 
 
 
@@ -0,0 +1,158 @@
+"""Compiled AdEx integrator shared by the interactive simulators.
+
+The kernel works in the GUI's native units (mV, pA, nS, pF, ms), which
+are mutually consistent for the AdEx right-hand side, so callers never
+convert. Numba is optional: without it the same function runs as plain
+Python, matching the dispatch style of src/gui/_fast.py.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# matches the Brian2 models: threshold='V > -20*mV'
+V_PEAK = -20.0
+
+# exp() is the most expensive op in the inner loop. The argument
+# (V - V_T)/Delta_T is bounded in practice — spikes reset V at V_PEAK —
+# so a clipped, linearly interpolated table covers the whole range the
+# loop can see. The upper clip doubles as the old runaway clamp: past it
+# the reset fires within a step or two regardless of the exact value.
+_EXP_X_MIN = -20.0
+_EXP_X_MAX = 30.0
+_EXP_LUT = np.exp(np.linspace(_EXP_X_MIN, _EXP_X_MAX, 1025))
+_EXP_SCALE = 1024.0 / (_EXP_X_MAX - _EXP_X_MIN)
+
+
+def _exp_lut_py(x):
+    if x < _EXP_X_MIN:
+        x = _EXP_X_MIN
+    elif x > _EXP_X_MAX:
+        x = _EXP_X_MAX
+    idx_f = (x - _EXP_X_MIN) * _EXP_SCALE
+    i = int(idx_f)
+    if i > 1023:
+        i = 1023
+    frac = idx_f - i
+    return _EXP_LUT[i] + frac * (_EXP_LUT[i + 1] - _EXP_LUT[i])
+
+
+def _adex_run_py(V, w, I, C, g_L, E_L, V_T, Delta_T, V_r, a, b, tau_w,
+                 dt, n_steps, V_out, w_out, spike_steps):
+    """Euler-integrate one AdEx neuron for n_steps of dt milliseconds.
+
+    Fills V_out/w_out with the trajectory and spike_steps with the step
+    index of each spike. Returns (V, w, n_spikes) so the caller can carry
+    the state into the next chunk.
+    """
+    # dw/dt is linear in w, so integrate it exactly over the step
+    # (exponential Euler, with V held at its start-of-step value);
+    # unconditionally stable for any dt
+    ew = np.exp(-dt / tau_w)
+    n_spikes = 0
+    for i in range(n_steps):
+        dV = (-g_L * (V - E_L) + g_L * Delta_T * _exp((V - V_T) / Delta_T)
+              - w + I) / C
+        w = w * ew + a * (V - E_L) * (1.0 - ew)
+        V += dt * dV
+        # branchless reset: near-threshold regimes make the spike branch
+        # unpredictable, so fold it into the arithmetic and keep only the
+        # rare recording branch
+        fired = 1.0 if V > V_PEAK else 0.0
+        V += fired * (V_r - V)
+        w += fired * b
+        if fired != 0.0:
+            spike_steps[n_spikes] = i
+            n_spikes += 1
+        V_out[i] = V
+        w_out[i] = w
+    return V, w, n_spikes
+
+
+def _adex_run_batch_py(V, w, I, C, g_L, E_L, V_T, Delta_T, V_r, a, b, tau_w,
+                       dt, n_steps, V_out, spike_steps, spike_neurons):
+    """Euler-integrate a batch of AdEx neurons for n_steps of dt milliseconds.
+
+    All neuron arguments, including the input current I, are arrays
+    indexed by neuron; V and w are updated in place so the caller can
+    carry the state into the next chunk. V_out
+    has shape (n_neurons, n_steps). Each spike is recorded as a
+    (step, neuron) pair in spike_steps/spike_neurons, ordered by step.
+    Returns the number of spikes.
+    """
+    n_neurons = len(V)
+    # see _adex_run_py: exact (exponential Euler) update for the linear w
+    ew = np.exp(-dt / tau_w)
+    n_spikes = 0
+    for i in range(n_steps):
+        for j in range(n_neurons):
+            dV = (-g_L[j] * (V[j] - E_L[j])
+                  + g_L[j] * Delta_T[j] * _exp((V[j] - V_T[j]) / Delta_T[j])
+                  - w[j] + I[j]) / C[j]
+            w[j] = w[j] * ew[j] + a[j] * (V[j] - E_L[j]) * (1.0 - ew[j])
+            V[j] += dt * dV
+            # branchless reset, as in _adex_run_py
+            fired = 1.0 if V[j] > V_PEAK else 0.0
+            V[j] += fired * (V_r[j] - V[j])
+            w[j] += fired * b[j]
+            if fired != 0.0:
+                spike_steps[n_spikes] = i
+                spike_neurons[n_spikes] = j
+                n_spikes += 1
+            V_out[j, i] = V[j]
+    return n_spikes
+
+
+@lru_cache(maxsize=16)
+def make_adex_kernel(C, g_L, E_L, V_T, Delta_T, V_r, a, b, tau_w, dt):
+    """Return an integrator specialized for one fixed parameter set.
+
+    The parameters are baked into the closure as compile-time constants,
+    so Numba folds the derived factors (1/C, g_L*Delta_T, the w decay)
+    instead of reloading them every step. Worth it only when the
+    parameters are stable for the whole session — compiling a variant
+    costs a few hundred ms and closures cannot use the on-disk cache —
+    so slider-driven simulators should stay on the generic adex_run.
+    """
+    inv_C = 1.0 / C
+    inv_Delta_T = 1.0 / Delta_T
+    gL_Delta_T = g_L * Delta_T
+    ew = np.exp(-dt / tau_w)
+    one_minus_ew = 1.0 - ew
+
+    def kernel(V, w, I, n_steps, V_out, w_out, spike_steps):
+        n_spikes = 0
+        for i in range(n_steps):
+            dV = (-g_L * (V - E_L) + gL_Delta_T * _exp((V - V_T) * inv_Delta_T)
+                  - w + I) * inv_C
+            w = w * ew + a * (V - E_L) * one_minus_ew
+            V += dt * dV
+            # branchless reset, as in _adex_run_py
+            fired = 1.0 if V > V_PEAK else 0.0
+            V += fired * (V_r - V)
+            w += fired * b
+            if fired != 0.0:
+                spike_steps[n_spikes] = i
+                n_spikes += 1
+            V_out[i] = V
+            w_out[i] = w
+        return V, w, n_spikes
+
+    if njit is not None:
+        kernel = njit(fastmath=True)(kernel)
+    return kernel
+
+
+if njit is not None:
+    _exp = njit(cache=True, fastmath=True, inline='always')(_exp_lut_py)
+    adex_run = njit(cache=True, fastmath=True)(_adex_run_py)
+    adex_run_batch = njit(cache=True, fastmath=True)(_adex_run_batch_py)
+else:
+    _exp = _exp_lut_py
+    adex_run = _adex_run_py
+    adex_run_batch = _adex_run_batch_py